@@ -5,24 +5,29 @@ Command-line interface for VectorWeight Homelab deployment automation
 """
 
 import logging
+import os
 import click
 import sys
 from pathlib import Path
 from typing import Optional, Dict, Any
-import yaml
-import json
 
+# yaml, json, and the generator tree are imported lazily inside the
+# commands that need them: they dominate cold-start cost but are dead
+# weight for --help, status, and deploy.
 from vectorweight.config.schema import (
-    VectorWaveConfiguration, EXAMPLE_CONFIGURATIONS
+    VectorWaveConfig, EXAMPLE_CONFIGS, EXAMPLE_CONFIG_SUMMARIES
 )
 from vectorweight.config.loader import ConfigurationLoader, ConfigurationValidator
-from vectorweight.generators.enhanced import EnhancedVectorWeightGenerator
 from vectorweight.utils.logging import setup_logging
 from vectorweight.utils.exceptions import ConfigurationError, ValidationError
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# One validator for the process: the compiled schema and validation cache it
+# fronts are module-level, so per-command instantiation buys nothing
+_VALIDATOR = ConfigurationValidator()
+
 
 @click.group()
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
@@ -63,10 +68,8 @@ def init(output: str, template: str, interactive: bool):
         if interactive:
             config = _interactive_configuration_wizard()
         else:
-            # Use predefined template
-            config_data = EXAMPLE_CONFIGURATIONS[template]
-            loader = ConfigurationLoader()
-            config = loader.load_from_dict(config_data)
+            # Use predefined template; only the chosen preset is built
+            config = EXAMPLE_CONFIGS[template]
         
         # Save configuration
         loader = ConfigurationLoader()
@@ -110,23 +113,19 @@ def generate(ctx, config: Optional[str], output: str, dry_run: bool, force: bool
         click.echo(f"📦 Clusters: {len(configuration.clusters)}")
         
         # Validate configuration
-        validator = ConfigurationValidator()
-        validation_messages = validator.validate(configuration)
-        
-        if validation_messages:
+        report = _VALIDATOR.validate(configuration)
+
+        if report:
             click.echo("\n📊 Validation Results:")
-            for message in validation_messages:
-                if message.startswith("Error:"):
-                    click.echo(f"❌ {message}", err=True)
-                elif message.startswith("Warning:"):
-                    click.echo(f"⚠️  {message}")
-                else:
-                    click.echo(f"ℹ️  {message}")
-        
-        # Check for errors
-        errors = [msg for msg in validation_messages if msg.startswith("Error:")]
-        if errors:
-            click.echo(f"\n❌ Configuration validation failed with {len(errors)} error(s)")
+            for message in report.errors:
+                click.echo(f"❌ {message.text}", err=True)
+            for message in report.warnings:
+                click.echo(f"⚠️  {message.text}")
+            for message in report.recommendations:
+                click.echo(f"ℹ️  {message.text}")
+
+        if report.errors:
+            click.echo(f"\n❌ Configuration validation failed with {len(report.errors)} error(s)")
             sys.exit(1)
         
         if dry_run:
@@ -135,7 +134,8 @@ def generate(ctx, config: Optional[str], output: str, dry_run: bool, force: bool
         
         # Generate deployment
         click.echo("\n🚀 Generating VectorWeight deployment...")
-        
+
+        from vectorweight.generators.enhanced import EnhancedVectorWeightGenerator
         generator = EnhancedVectorWeightGenerator(configuration)
         generator.output_path = Path(output)
         
@@ -176,43 +176,43 @@ def validate(ctx, config: Optional[str], detailed: bool):
         loader = ConfigurationLoader()
         configuration = loader.load_from_file(Path(config_file))
         
-        validator = ConfigurationValidator()
-        validation_messages = validator.validate(configuration)
-        
+        report = _VALIDATOR.validate(configuration)
+
         # Display results
         click.echo(f"📋 Validating: {configuration.project_name}")
-        
-        if not validation_messages:
+
+        if not report:
             click.echo("✅ Configuration validation passed!")
             return
-        
-        # Categorize messages
-        errors = [msg for msg in validation_messages if msg.startswith("Error:")]
-        warnings = [msg for msg in validation_messages if msg.startswith("Warning:")]
-        recommendations = [msg for msg in validation_messages if msg.startswith("Recommendation:")]
-        
-        # Display summary
-        click.echo(f"\n📊 Validation Summary:")
-        click.echo(f"   Errors: {len(errors)}")
-        click.echo(f"   Warnings: {len(warnings)}")
-        click.echo(f"   Recommendations: {len(recommendations)}")
-        
+
+        errors = report.errors
+        warnings = report.warnings
+        recommendations = report.recommendations
+
+        # Display summary; build the output in memory and write it once
+        # instead of paying a flush per line
+        out = [
+            "\n📊 Validation Summary:",
+            f"   Errors: {len(errors)}",
+            f"   Warnings: {len(warnings)}",
+            f"   Recommendations: {len(recommendations)}",
+        ]
+
         if detailed or errors:
             if errors:
-                click.echo(f"\n❌ Errors ({len(errors)}):")
-                for error in errors:
-                    click.echo(f"   {error}")
-            
+                out.append(f"\n❌ Errors ({len(errors)}):")
+                out.extend(f"   {error.text}" for error in errors)
+
             if warnings and detailed:
-                click.echo(f"\n⚠️  Warnings ({len(warnings)}):")
-                for warning in warnings:
-                    click.echo(f"   {warning}")
-            
+                out.append(f"\n⚠️  Warnings ({len(warnings)}):")
+                out.extend(f"   {warning.text}" for warning in warnings)
+
             if recommendations and detailed:
-                click.echo(f"\nℹ️  Recommendations ({len(recommendations)}):")
-                for rec in recommendations:
-                    click.echo(f"   {rec}")
-        
+                out.append(f"\nℹ️  Recommendations ({len(recommendations)}):")
+                out.extend(f"   {rec.text}" for rec in recommendations)
+
+        click.echo('\n'.join(out))
+
         if errors:
             sys.exit(1)
             
@@ -243,56 +243,103 @@ def deploy(ctx, config: Optional[str], deployment_dir: Optional[str], wait: bool
         sys.exit(1)
     
     try:
-        import subprocess
-        
         click.echo("🚀 Deploying VectorWeight homelab...")
-        
-        # Execute deployment script
+
+        if not wait:
+            # Nothing runs after the script other than forwarding its exit
+            # code, so replace this process with it outright: no fork, no
+            # idle interpreter held resident for the duration of the deploy.
+            # Note: atexit handlers and click cleanup do not run past here.
+            # The script path must be absolute before the chdir invalidates
+            # relative deployment dirs (including the default).
+            deploy_script = deploy_script.resolve()
+            os.chdir(deployment_path)
+            os.execvp(str(deploy_script), [str(deploy_script)])
+
+        # --wait needs the Python process to survive the script so it can
+        # monitor progress afterward
+        import subprocess
+
         result = subprocess.run(
             [str(deploy_script)],
             cwd=deployment_path,
             capture_output=False,
             text=True
         )
-        
+
         if result.returncode == 0:
             click.echo("✅ Deployment initiated successfully!")
-            if wait:
-                click.echo("⏳ Monitoring deployment progress...")
-                _monitor_deployment_progress()
+            click.echo("⏳ Monitoring deployment progress...")
+            _monitor_deployment_progress()
         else:
             click.echo("❌ Deployment failed!")
             sys.exit(1)
-            
+
     except Exception as e:
         click.echo(f"❌ Deployment execution failed: {e}", err=True)
         sys.exit(1)
 
 
 @cli.command()
-@click.option('--format', type=click.Choice(['table', 'json', 'yaml']), 
+@click.option('--format', 'format', type=click.Choice(['table', 'json', 'yaml']),
               default='table', help='Output format')
-def examples():
+def examples(format: str):
     """Show example configurations"""
-    
-    if click.get_current_context().params['format'] == 'table':
-        click.echo("📋 Available Configuration Examples:\n")
-        
-        for name, config in EXAMPLE_CONFIGURATIONS.items():
-            click.echo(f"🔧 {name}")
-            click.echo(f"   Project: {config.get('project_name', 'N/A')}")
-            click.echo(f"   Environment: {config.get('environment', 'N/A')}")
-            click.echo(f"   Deployment Mode: {config.get('deployment_mode', 'N/A')}")
-            click.echo(f"   Clusters: {len(config.get('clusters', []))}")
-            click.echo()
-        
-        click.echo("💡 Use 'vectorweight init --template <name>' to create configuration")
-        
-    elif click.get_current_context().params['format'] == 'json':
-        click.echo(json.dumps(EXAMPLE_CONFIGURATIONS, indent=2, default=str))
-        
-    elif click.get_current_context().params['format'] == 'yaml':
-        click.echo(yaml.dump(EXAMPLE_CONFIGURATIONS, default_flow_style=False))
+
+    _EXAMPLE_PRINTERS[format](EXAMPLE_CONFIGS)
+
+
+def _print_examples_table(configurations):
+    """Print preset summaries without materializing any configuration"""
+    click.echo("📋 Available Configuration Examples:\n")
+
+    for name, summary in EXAMPLE_CONFIG_SUMMARIES.items():
+        click.echo(f"🔧 {name}")
+        click.echo(f"   Project: {summary.get('project_name', 'N/A')}")
+        click.echo(f"   Environment: {summary.get('environment', 'N/A')}")
+        click.echo(f"   Deployment Mode: {summary.get('deployment_mode', 'N/A')}")
+        click.echo(f"   Clusters: {summary.get('cluster_count', 0)}")
+        click.echo()
+
+    click.echo("💡 Use 'vectorweight init --template <name>' to create configuration")
+
+
+def _examples_as_dicts(configurations) -> Dict[str, Dict[str, Any]]:
+    # The loader's serializer maps enums to their values, frozensets to
+    # sorted lists, and Paths to strings — raw asdict leaves those types
+    # in the tree, which SafeDumper refuses and json mangles via str()
+    serialize = ConfigurationLoader()._serialize_config
+    return {name: serialize(config) for name, config in configurations.items()}
+
+
+def _print_examples_json(configurations):
+    data = _examples_as_dicts(configurations)
+    # orjson serializes the nested dicts and enums in C with no
+    # per-value Python callback; stdlib json is the fallback
+    try:
+        import orjson
+        click.echo(orjson.dumps(data, option=orjson.OPT_INDENT_2,
+                                default=str).decode())
+    except ImportError:
+        import json
+        click.echo(json.dumps(data, indent=2, default=str))
+
+
+def _print_examples_yaml(configurations):
+    import yaml
+    try:
+        from yaml import CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeDumper
+    click.echo(yaml.dump(_examples_as_dicts(configurations), Dumper=SafeDumper,
+                         default_flow_style=False))
+
+
+_EXAMPLE_PRINTERS = {
+    'table': _print_examples_table,
+    'json': _print_examples_json,
+    'yaml': _print_examples_yaml,
+}
 
 
 @cli.command()
@@ -325,21 +372,31 @@ def status(namespace: str):
         else:
             click.echo("❌ Argo CD not found")
         
-        # Check applications
+        # Check applications; structured JSON output is robust against
+        # column changes and decodes faster via orjson when available
+        try:
+            from orjson import loads as _json_loads
+        except ImportError:
+            from json import loads as _json_loads
+
         click.echo("\n📦 Applications:")
         result = subprocess.run([
-            'kubectl', 'get', 'applications', '-n', namespace
-        ], capture_output=True, text=True)
-        
+            'kubectl', 'get', 'applications', '-n', namespace, '-o', 'json'
+        ], capture_output=True)
+
         if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            if len(lines) > 1:
-                for line in lines[1:]:  # Skip header
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        name, health, sync = parts[0], parts[1], parts[2]
-                        status_icon = "✅" if health == "Healthy" and sync == "Synced" else "⚠️"
-                        click.echo(f"   {status_icon} {name}: {health}/{sync}")
+            payload = _json_loads(result.stdout)
+            applications = payload.get('items', [])
+            if applications:
+                lines = []
+                for app in applications:
+                    name = app['metadata']['name']
+                    app_status = app.get('status', {})
+                    health = app_status.get('health', {}).get('status', 'Unknown')
+                    sync = app_status.get('sync', {}).get('status', 'Unknown')
+                    status_icon = "✅" if health == "Healthy" and sync == "Synced" else "⚠️"
+                    lines.append(f"   {status_icon} {name}: {health}/{sync}")
+                click.echo('\n'.join(lines))
             else:
                 click.echo("   No applications found")
         else:
@@ -349,7 +406,7 @@ def status(namespace: str):
         click.echo(f"❌ Status check failed: {e}", err=True)
 
 
-def _interactive_configuration_wizard() -> VectorWaveConfiguration:
+def _interactive_configuration_wizard() -> VectorWaveConfig:
     """Interactive configuration wizard"""
     
     click.echo("🧙 VectorWeight Configuration Wizard\n")
@@ -426,40 +483,91 @@ def _interactive_configuration_wizard() -> VectorWaveConfiguration:
     return loader.load_from_dict(config_data)
 
 
-def _monitor_deployment_progress():
-    """Monitor Argo CD deployment progress"""
+def _monitor_deployment_progress(namespace: str = 'argocd', timeout: int = 300):
+    """Monitor Argo CD deployment progress until all applications are healthy"""
     import subprocess
     import time
-    
+
+    # kubectl wait blocks inside the Go binary on watch semantics and
+    # returns the moment every Application meets the condition — no
+    # Python wakeups at all. --for is single-valued (a repeat silently
+    # overrides the first), so the sync and health conditions run as two
+    # sequential waits sharing one deadline. Older kubectl without
+    # jsonpath wait support errors out immediately, in which case the
+    # streaming watch below takes over.
+    deadline = time.monotonic() + timeout
     try:
-        for _ in range(30):  # Monitor for 5 minutes
+        for condition in ('--for=jsonpath={.status.sync.status}=Synced',
+                          '--for=jsonpath={.status.health.status}=Healthy'):
+            remaining = max(int(deadline - time.monotonic()), 1)
             result = subprocess.run([
-                'kubectl', 'get', 'applications', '-n', 'argocd', '--no-headers'
+                'kubectl', 'wait', condition,
+                'applications', '--all', '-n', namespace,
+                f'--timeout={remaining}s'
             ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                healthy_count = 0
-                total_count = len([l for l in lines if l.strip()])
-                
-                for line in lines:
-                    if line.strip():
-                        parts = line.split()
-                        if len(parts) >= 3 and parts[1] == "Healthy" and parts[2] == "Synced":
-                            healthy_count += 1
-                
-                click.echo(f"📊 Applications: {healthy_count}/{total_count} healthy")
-                
-                if healthy_count == total_count and total_count > 0:
-                    click.echo("✅ All applications are healthy!")
-                    break
-            
-            time.sleep(10)
-    
+            if result.returncode != 0:
+                break
+        else:
+            click.echo("✅ All applications are synced and healthy!")
+            return
+        if 'timed out' in result.stderr:
+            click.echo("⚠️  Timed out waiting for applications to become healthy")
+            return
+    except FileNotFoundError:
+        click.echo("❌ kubectl not found; cannot monitor deployment")
+        return
+
+    _watch_deployment_progress(namespace, timeout)
+
+
+def _watch_deployment_progress(namespace: str = 'argocd', timeout: int = 300):
+    """Fallback monitor: parse a streaming kubectl watch of Applications"""
+    import subprocess
+    import threading
+
+    # One kubectl watch replaces the previous 10-second polling loop: the
+    # API server pushes each Application change instead of being re-listed
+    # every tick, and only one process is spawned for the whole monitor.
+    proc = subprocess.Popen([
+        'kubectl', 'get', 'applications', '-n', namespace, '-w',
+        '-o', 'custom-columns=NAME:.metadata.name,'
+              'HEALTH:.status.health.status,SYNC:.status.sync.status',
+        '--no-headers'
+    ], stdout=subprocess.PIPE, text=True, bufsize=1)
+
+    watchdog = threading.Timer(timeout, proc.terminate)
+    watchdog.start()
+
+    app_state = {}
+    try:
+        for line in proc.stdout:
+            parts = line.split()
+            if len(parts) < 3:
+                continue
+
+            name, health, sync = parts[0], parts[1], parts[2]
+            app_state[name] = (health, sync)
+
+            healthy_count = sum(
+                1 for h, s in app_state.values()
+                if h == "Healthy" and s == "Synced"
+            )
+            total_count = len(app_state)
+            click.echo(f"📊 Applications: {healthy_count}/{total_count} healthy")
+
+            if healthy_count == total_count and total_count > 0:
+                click.echo("✅ All applications are healthy!")
+                proc.terminate()
+                break
+
     except KeyboardInterrupt:
+        proc.terminate()
         click.echo("\n⏹️  Monitoring stopped by user")
     except Exception as e:
         click.echo(f"❌ Monitoring failed: {e}")
+    finally:
+        watchdog.cancel()
+        proc.wait()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+VectorWeight Configuration Loader
+Configuration file loading, saving, and validation for VectorWaveConfig
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+from vectorweight.config.schema import (
+    VectorWaveConfig, ClusterConfig, SourceConfig, AuthConfig,
+    DeploymentMode, ClusterSize, VectorStoreType, build_json_schema,
+    Severity, ValidationMessage, ValidationReport
+)
+from vectorweight.utils.exceptions import ConfigurationError
+
+# Prefer the libyaml C bindings when PyYAML was built against them; the
+# pure-Python parser/emitter is an order of magnitude slower on large configs.
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+logger = logging.getLogger(__name__)
+
+
+# Accepted top-level keys, derived from the dataclass once at import so
+# load_from_dict does a frozenset probe per key instead of rebuilding the
+# field list on every call
+import dataclasses as _dataclasses
+_KNOWN_CONFIG_FIELDS = frozenset(
+    f.name for f in _dataclasses.fields(VectorWaveConfig)
+    if f.name not in ("clusters", "source") and not f.name.startswith("_")
+)
+
+
+def _coerce_enum(enum_cls, value, field_name: str):
+    """Resolve an enum member from its value via the precomputed lookup table"""
+    if isinstance(value, enum_cls):
+        return value
+    try:
+        return enum_cls.from_value(value)
+    except KeyError:
+        raise ConfigurationError(
+            f"Invalid {field_name}: {value!r} "
+            f"(expected one of {sorted(enum_cls._lookup)})"
+        )
+
+
+# Structural validation goes through a validator compiled once at import:
+# fastjsonschema codegens a straight-line Python function from the schema,
+# so per-call validation avoids the interpreted dataclass-tree walk. When
+# fastjsonschema is not installed only the semantic Python checks run.
+try:
+    import fastjsonschema
+    _COMPILED_SCHEMA_VALIDATOR = fastjsonschema.compile(build_json_schema())
+except ImportError:
+    fastjsonschema = None
+    _COMPILED_SCHEMA_VALIDATOR = None
+
+
+# Parsed configurations keyed by (path, mtime_ns, size): a stat call is all
+# it costs to let generate reuse the config a preceding validate already
+# parsed, without risking staleness when the file is edited in between
+_parsed_config_cache: Dict[tuple, VectorWaveConfig] = {}
+
+
+class ConfigurationLoader:
+    """Loads and saves VectorWeight configurations from YAML files and dicts"""
+
+    def load_from_file(self, path: Path) -> VectorWaveConfig:
+        """Load configuration from a YAML file"""
+        if not path.exists():
+            raise ConfigurationError(f"Configuration file not found: {path}")
+
+        stat = path.stat()
+        cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        cached = _parsed_config_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            raw_yaml = path.read_bytes()
+            config_data = yaml.load(raw_yaml, Loader=SafeLoader)
+        except yaml.YAMLError as e:
+            raise ConfigurationError(f"Invalid YAML in {path}: {e}")
+
+        if not isinstance(config_data, dict):
+            raise ConfigurationError(f"Configuration root must be a mapping: {path}")
+
+        config = self.load_from_dict(config_data)
+        config._content_hash = hashlib.blake2b(raw_yaml).hexdigest()
+        _parsed_config_cache[cache_key] = config
+        return config
+
+    def load_from_dict(self, config_data: Dict[str, Any]) -> VectorWaveConfig:
+        """Build a VectorWaveConfig from a plain dictionary"""
+        try:
+            clusters = [
+                self._build_cluster(cluster_data)
+                for cluster_data in config_data.get("clusters", [])
+            ]
+
+            source = None
+            if config_data.get("source"):
+                source = self._build_source(config_data["source"])
+
+            kwargs = {k: v for k, v in config_data.items()
+                      if k in _KNOWN_CONFIG_FIELDS}
+
+            if "deployment_mode" in kwargs:
+                kwargs["deployment_mode"] = _coerce_enum(
+                    DeploymentMode, kwargs["deployment_mode"], "deployment_mode")
+
+            return VectorWaveConfig(clusters=clusters, source=source, **kwargs)
+
+        except (KeyError, TypeError, ValueError) as e:
+            raise ConfigurationError(f"Invalid configuration structure: {e}")
+
+    def save_to_file(self, config: VectorWaveConfig, path: Path) -> None:
+        """Save configuration to a YAML file"""
+        config_dict = self._serialize_config(config)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            yaml.dump(config_dict, f, Dumper=SafeDumper, default_flow_style=False)
+
+        logger.info(f"Configuration saved: {path}")
+
+    def _build_cluster(self, cluster_data: Dict[str, Any]) -> ClusterConfig:
+        """Build a ClusterConfig from a plain dictionary"""
+        kwargs = dict(cluster_data)
+        if "size" in kwargs:
+            kwargs["size"] = _coerce_enum(ClusterSize, kwargs["size"], "size")
+        if "vector_store" in kwargs:
+            kwargs["vector_store"] = _coerce_enum(
+                VectorStoreType, kwargs["vector_store"], "vector_store")
+        if "specialized_workloads" in kwargs:
+            kwargs["specialized_workloads"] = frozenset(kwargs["specialized_workloads"])
+        return ClusterConfig(**kwargs)
+
+    def _build_source(self, source_data: Dict[str, Any]) -> SourceConfig:
+        """Build a SourceConfig from a plain dictionary"""
+        kwargs = dict(source_data)
+        if "type" in kwargs:
+            kwargs["type"] = _coerce_enum(DeploymentMode, kwargs["type"], "source type")
+
+        # Credentials may be nested under "auth" or given as legacy flat
+        # keys; either way they end up in one optional AuthConfig. Paths
+        # stay strings — Path objects are built lazily on access.
+        auth_data = kwargs.pop("auth", None) or {}
+        for legacy_key in ("username", "password", "token", "ca_cert"):
+            if legacy_key in kwargs:
+                auth_data.setdefault(legacy_key, kwargs.pop(legacy_key))
+        if auth_data:
+            kwargs["auth"] = AuthConfig(**auth_data)
+
+        return SourceConfig(**kwargs)
+
+    def _serialize_config(self, config: VectorWaveConfig) -> Dict[str, Any]:
+        """Convert a VectorWaveConfig to a YAML-safe dictionary"""
+        # Underscore-prefixed keys are the init=False cache fields
+        # (_content_hash, _path_obj, ...); asdict includes them but the
+        # dataclass constructors reject them on reload, so they must
+        # never reach the file
+        def _convert(value):
+            if hasattr(value, "value"):  # Enum members
+                return value.value
+            if isinstance(value, Path):
+                return str(value)
+            if isinstance(value, dict):
+                return {k: _convert(v) for k, v in value.items()
+                        if not (isinstance(k, str) and k.startswith("_"))}
+            if isinstance(value, (frozenset, set)):
+                return sorted(_convert(v) for v in value)
+            if isinstance(value, (list, tuple)):
+                return [_convert(v) for v in value]
+            return value
+
+        return {k: _convert(v) for k, v in asdict(config).items()
+                if v is not None and not k.startswith("_")}
+
+
+# Validation results keyed by the configuration content hash. Repeat CLI
+# invocations on an unchanged file (validate followed by generate, CI loops)
+# skip the full traversal; results persist across processes on disk.
+_VALIDATION_CACHE_PATH = Path.home() / ".cache" / "vectorweight" / "validation.json"
+_validation_cache: Optional[Dict[str, list]] = None
+
+
+def _load_validation_cache() -> Dict[str, list]:
+    global _validation_cache
+    if _validation_cache is None:
+        try:
+            _validation_cache = json.loads(_VALIDATION_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            _validation_cache = {}
+    return _validation_cache
+
+
+def _store_validation_result(content_hash: str, report: ValidationReport) -> None:
+    cache = _load_validation_cache()
+    cache[content_hash] = [
+        [m.severity.value, m.text, m.path] for m in report.all_messages()
+    ]
+    try:
+        _VALIDATION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _VALIDATION_CACHE_PATH.write_text(json.dumps(cache))
+    except OSError:
+        logger.debug("Could not persist validation cache", exc_info=True)
+
+
+def _report_from_cache(entries: list) -> ValidationReport:
+    report = ValidationReport()
+    for severity, text, path in entries:
+        report.add(Severity(severity), text, path)
+    return report
+
+
+class ConfigurationValidator:
+    """Validates VectorWeight configurations for structural and semantic issues"""
+
+    def validate(self, config: VectorWaveConfig) -> ValidationReport:
+        """
+        Validate configuration and return a ValidationReport
+
+        Findings land in the report's errors/warnings/recommendations
+        buckets directly, so callers index by severity instead of
+        re-scanning message prefixes.
+        """
+        content_hash = getattr(config, "_content_hash", None)
+        if content_hash is not None:
+            cached = _load_validation_cache().get(content_hash)
+            if cached is not None:
+                logger.debug(f"Validation cache hit: {content_hash[:16]}")
+                return _report_from_cache(cached)
+
+        report = self._validate_uncached(config)
+
+        if content_hash is not None:
+            _store_validation_result(content_hash, report)
+
+        return report
+
+    def _validate_uncached(self, config: VectorWaveConfig) -> ValidationReport:
+        """Run structural (compiled schema) then semantic validation"""
+        report = ValidationReport()
+
+        if _COMPILED_SCHEMA_VALIDATOR is not None:
+            config_dict = ConfigurationLoader()._serialize_config(config)
+            try:
+                _COMPILED_SCHEMA_VALIDATOR(config_dict)
+            except fastjsonschema.JsonSchemaException as e:
+                report.add(Severity.ERROR,
+                           f"Schema validation failed: {e.message}")
+
+        if not config.clusters:
+            report.add(Severity.ERROR, "At least one cluster must be defined")
+
+        seen_names = set()
+        for cluster in config.clusters:
+            if cluster.name in seen_names:
+                report.add(Severity.ERROR,
+                           f"Duplicate cluster name: {cluster.name}",
+                           path=f"clusters.{cluster.name}")
+            seen_names.add(cluster.name)
+
+            if not cluster.domain:
+                report.add(Severity.ERROR,
+                           f"Cluster {cluster.name} has no domain",
+                           path=f"clusters.{cluster.name}.domain")
+
+            if cluster.gpu_enabled and cluster.size == ClusterSize.MINIMAL:
+                report.add(Severity.WARNING,
+                           f"Cluster {cluster.name} enables GPU on a minimal cluster",
+                           path=f"clusters.{cluster.name}.gpu_enabled")
+
+            if cluster.vector_store != VectorStoreType.DISABLED and cluster.size == ClusterSize.MINIMAL:
+                report.add(Severity.WARNING,
+                           f"Cluster {cluster.name} runs a vector store on a minimal cluster",
+                           path=f"clusters.{cluster.name}.vector_store")
+
+        if config.deployment_mode != DeploymentMode.INTERNET and config.source is None:
+            report.add(Severity.ERROR,
+                       "Airgapped deployment modes require a source configuration",
+                       path="source")
+
+        if config.deployment_mode == DeploymentMode.INTERNET and not config.enable_security_cluster:
+            report.add(Severity.RECOMMENDATION,
+                       "Enable the security cluster for internet-connected deployments",
+                       path="enable_security_cluster")
+
+        return report
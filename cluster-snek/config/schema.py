@@ -4,12 +4,31 @@ Enhanced VectorWeight Homelab Configuration Schema
 Simplified, concise configuration for comprehensive deployment automation
 """
 
+import sys
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union, Literal
+from functools import cache
+from typing import Any
 from pathlib import Path
 from enum import Enum
 
-class DeploymentMode(Enum):
+# StrEnum members are str instances, so comparisons against raw config
+# strings and JSON/YAML emission need no .value unwrapping (3.11+)
+try:
+    from enum import StrEnum
+except ImportError:
+    class StrEnum(str, Enum):
+        pass
+
+class _ValueLookupEnum(StrEnum):
+    """Enum base exposing value resolution through the precomputed table"""
+
+    @classmethod
+    def from_value(cls, value):
+        """Resolve a member from its value with a single dict lookup"""
+        return cls._lookup[value]
+
+class DeploymentMode(_ValueLookupEnum):
     """Deployment mode options"""
     INTERNET = "internet"
     AIRGAPPED_VC = "airgapped-vc" 
@@ -17,35 +36,77 @@ class DeploymentMode(Enum):
     AIRGAPPED_NETWORK = "airgapped-network"
     AIRGAPPED_ARCHIVE = "airgapped-archive"
 
-class ClusterSize(Enum):
+class ClusterSize(_ValueLookupEnum):
     """Cluster deployment size options"""
     MINIMAL = "minimal"      # Single node, basic features
     SMALL = "small"         # 2-3 nodes, standard features
     MEDIUM = "medium"       # 3-5 nodes, full features
     LARGE = "large"         # 5+ nodes, enterprise features
 
-class VectorStoreType(Enum):
+class VectorStoreType(_ValueLookupEnum):
     """Vector store implementation options"""
     DISABLED = "disabled"
     WEAVIATE = "weaviate"
-    QDRANT = "qdrant" 
+    QDRANT = "qdrant"
     CHROMA = "chroma"
     IN_MEMORY = "in-memory"
 
-@dataclass
+# Precomputed value -> member tables: a plain dict hit is cheaper than the
+# Enum metaclass call on the hot parse path, where these conversions run
+# once per field per cluster
+DeploymentMode._lookup = {m.value: m for m in DeploymentMode}
+ClusterSize._lookup = {m.value: m for m in ClusterSize}
+VectorStoreType._lookup = {m.value: m for m in VectorStoreType}
+
+@dataclass(slots=True)
+class AuthConfig:
+    """Credentials for authenticated source fetching"""
+    username: str | None = None
+    password: str | None = None
+    token: str | None = None
+    ca_cert: str | None = None
+
+    _ca_cert_obj: Path | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if isinstance(self.ca_cert, Path):
+            self.ca_cert = str(self.ca_cert)
+
+    @property
+    def ca_cert_obj(self) -> Path | None:
+        if self._ca_cert_obj is None and self.ca_cert is not None:
+            self._ca_cert_obj = Path(self.ca_cert)
+        return self._ca_cert_obj
+
+@dataclass(slots=True)
 class SourceConfig:
     """Source configuration for airgapped deployments"""
     type: DeploymentMode
-    url: Optional[str] = None
-    path: Optional[Path] = None
-    username: Optional[str] = None
-    password: Optional[str] = None
-    token: Optional[str] = None
-    ca_cert: Optional[Path] = None
-    archive_format: Optional[str] = "tar.gz"
+    url: str | None = None
+    path: str | None = None
+    # Credentials grouped into one optional sub-config: anonymous sources
+    # (the common case) check a single None instead of four fields
+    auth: AuthConfig | None = None
+    archive_format: str | None = "tar.gz"
     verification_enabled: bool = True
 
-@dataclass 
+    # Lazily built Path object: pathlib construction is far costlier than
+    # keeping the raw string, and most runs never touch this field
+    _path_obj: Path | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.url is not None:
+            self.url = sys.intern(self.url)
+        if isinstance(self.path, Path):
+            self.path = str(self.path)
+
+    @property
+    def path_obj(self) -> Path | None:
+        if self._path_obj is None and self.path is not None:
+            self._path_obj = Path(self.path)
+        return self._path_obj
+
+@dataclass(slots=True)
 class ClusterConfig:
     """Simplified cluster configuration"""
     name: str
@@ -54,9 +115,17 @@ class ClusterConfig:
     gpu_enabled: bool = False
     vector_store: VectorStoreType = VectorStoreType.DISABLED
     cerbos_enabled: bool = False
-    specialized_workloads: List[str] = field(default_factory=list)
-    
-@dataclass
+    specialized_workloads: frozenset[str] = field(default_factory=frozenset)
+
+    def __post_init__(self):
+        # Names and domains repeat across presets, manifests, and repo
+        # paths; interning collapses duplicates and turns downstream
+        # equality checks and dict keying into pointer compares
+        self.name = sys.intern(self.name)
+        self.domain = sys.intern(self.domain)
+
+
+@dataclass(slots=True)
 class VectorWaveConfig:
     """Main configuration for VectorWeight Homelab deployment"""
     
@@ -66,10 +135,10 @@ class VectorWaveConfig:
     deployment_mode: DeploymentMode = DeploymentMode.INTERNET
     
     # Deployment targets
-    clusters: List[ClusterConfig] = field(default_factory=list)
-    
+    clusters: list[ClusterConfig] = field(default_factory=list)
+
     # Source configuration for airgapped deployments
-    source: Optional[SourceConfig] = None
+    source: SourceConfig | None = None
     
     # Infrastructure options
     use_vms: bool = True  # False = deploy directly on host
@@ -95,11 +164,166 @@ class VectorWaveConfig:
     ip_pool_end: str = "192.168.1.250"
     
     # Minimal required overrides
-    overrides: Dict[str, any] = field(default_factory=dict)
+    overrides: dict[str, Any] = field(default_factory=dict)
+
+    # Content hash of the source YAML, set by ConfigurationLoader.load_from_file
+    # and used to key validation-result caching
+    _content_hash: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    # Lazily computed cluster-derived facts, so repeated queries don't
+    # rescan the cluster list (same caching pattern as SourceConfig paths)
+    _any_gpu: bool | None = field(default=None, init=False, repr=False, compare=False)
+    _vector_store_backends: frozenset | None = field(default=None, init=False, repr=False, compare=False)
+    _ip_pool_ints: tuple | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.domain = sys.intern(self.domain)
+        self.github_org = sys.intern(self.github_org)
+        self.sync_policy = sys.intern(self.sync_policy)
+
+    @property
+    def is_airgapped(self) -> bool:
+        return self.deployment_mode != DeploymentMode.INTERNET
+
+    @property
+    def any_gpu(self) -> bool:
+        if self._any_gpu is None:
+            self._any_gpu = any(c.gpu_enabled for c in self.clusters)
+        return self._any_gpu
+
+    @property
+    def vector_store_backends(self) -> frozenset:
+        """Distinct vector store types enabled across clusters"""
+        if self._vector_store_backends is None:
+            self._vector_store_backends = frozenset(
+                c.vector_store for c in self.clusters
+                if c.vector_store != VectorStoreType.DISABLED
+            )
+        return self._vector_store_backends
+
+    def _ip_pool_bounds(self) -> tuple:
+        """Pool bounds as integers, parsed once from the dotted strings"""
+        if self._ip_pool_ints is None:
+            import ipaddress
+            self._ip_pool_ints = (
+                int(ipaddress.IPv4Address(self.ip_pool_start)),
+                int(ipaddress.IPv4Address(self.ip_pool_end)),
+            )
+        return self._ip_pool_ints
+
+    @property
+    def ip_pool_size(self) -> int:
+        start, end = self._ip_pool_bounds()
+        return max(0, end - start + 1)
+
+    def ip_pool_iter(self):
+        """Iterate the address pool using integer arithmetic per step"""
+        import ipaddress
+        start, end = self._ip_pool_bounds()
+        return (ipaddress.IPv4Address(i) for i in range(start, end + 1))
+
+class Severity(Enum):
+    """Validation message severity levels"""
+    ERROR = "Error"
+    WARNING = "Warning"
+    RECOMMENDATION = "Recommendation"
+
+@dataclass(slots=True)
+class ValidationMessage:
+    """A single validation finding"""
+    severity: Severity
+    text: str
+    path: str = ""
+
+@dataclass(slots=True)
+class ValidationReport:
+    """Structured validation results, bucketed by severity"""
+    errors: list[ValidationMessage] = field(default_factory=list)
+    warnings: list[ValidationMessage] = field(default_factory=list)
+    recommendations: list[ValidationMessage] = field(default_factory=list)
 
-# Example configurations
-EXAMPLE_CONFIGS = {
-    "minimal_dev": VectorWaveConfig(
+    _BUCKETS = {
+        Severity.ERROR: "errors",
+        Severity.WARNING: "warnings",
+        Severity.RECOMMENDATION: "recommendations",
+    }
+
+    def add(self, severity: Severity, text: str, path: str = "") -> None:
+        getattr(self, self._BUCKETS[severity]).append(
+            ValidationMessage(severity, text, path))
+
+    def __bool__(self) -> bool:
+        return bool(self.errors or self.warnings or self.recommendations)
+
+    def all_messages(self) -> list[ValidationMessage]:
+        return [*self.errors, *self.warnings, *self.recommendations]
+
+
+def build_json_schema() -> dict:
+    """
+    Derive a JSON Schema for VectorWaveConfig from the dataclass definitions
+
+    The schema mirrors the YAML structure accepted by ConfigurationLoader:
+    enums map to "enum" constraints, Optional fields accept null, and
+    nested dataclasses become nested object schemas. Built once so callers
+    can compile it (e.g. with fastjsonschema) and reuse the compiled
+    validator across CLI invocations.
+    """
+    import dataclasses
+    import types
+    import typing
+
+    def _type_schema(field_type) -> dict:
+        origin = typing.get_origin(field_type)
+        args = typing.get_args(field_type)
+
+        if origin is typing.Union or origin is types.UnionType:
+            non_none = [a for a in args if a is not type(None)]
+            inner = _type_schema(non_none[0])
+            inner_type = inner.get("type")
+            if isinstance(inner_type, str):
+                inner["type"] = [inner_type, "null"]
+            return inner
+        if origin is list:
+            return {"type": "array", "items": _type_schema(args[0]) if args else {}}
+        if origin is dict:
+            return {"type": "object"}
+        if isinstance(field_type, type) and issubclass(field_type, Enum):
+            return {"enum": [m.value for m in field_type]}
+        if dataclasses.is_dataclass(field_type):
+            return _dataclass_schema(field_type)
+        if field_type is bool:
+            return {"type": "boolean"}
+        if field_type in (str, Path):
+            return {"type": "string"}
+        return {}
+
+    def _dataclass_schema(cls) -> dict:
+        properties = {}
+        required = []
+        for f in dataclasses.fields(cls):
+            if f.name.startswith("_"):
+                continue
+            properties[f.name] = _type_schema(f.type if not isinstance(f.type, str)
+                                              else typing.get_type_hints(cls)[f.name])
+            if (f.default is dataclasses.MISSING
+                    and f.default_factory is dataclasses.MISSING):
+                required.append(f.name)
+        schema = {"type": "object", "properties": properties}
+        if required:
+            schema["required"] = required
+        return schema
+
+    return _dataclass_schema(VectorWaveConfig)
+
+
+# Example configurations: each preset is built lazily on first access so
+# commands that pick a single template (or only print the summary table)
+# never construct the unrequested object graphs.
+
+@cache
+def _build_minimal_dev() -> VectorWaveConfig:
+    return VectorWaveConfig(
         clusters=[
             ClusterConfig(
                 name="dev",
@@ -109,13 +333,15 @@ EXAMPLE_CONFIGS = {
         ],
         use_vms=False,
         enable_security_cluster=False
-    ),
-    
-    "full_production": VectorWaveConfig(
+    )
+
+@cache
+def _build_full_production() -> VectorWaveConfig:
+    return VectorWaveConfig(
         clusters=[
             ClusterConfig(
                 name="dev-cluster",
-                domain="dev.vectorweight.com", 
+                domain="dev.vectorweight.com",
                 size=ClusterSize.SMALL
             ),
             ClusterConfig(
@@ -124,10 +350,10 @@ EXAMPLE_CONFIGS = {
                 size=ClusterSize.MEDIUM,
                 gpu_enabled=True,
                 vector_store=VectorStoreType.WEAVIATE,
-                specialized_workloads=["machine-learning", "ai-inference"]
+                specialized_workloads=frozenset({"machine-learning", "ai-inference"})
             ),
             ClusterConfig(
-                name="homelab-cluster", 
+                name="homelab-cluster",
                 domain="homelab.vectorweight.com",
                 size=ClusterSize.SMALL
             ),
@@ -135,21 +361,25 @@ EXAMPLE_CONFIGS = {
                 name="security-cluster",
                 domain="sec.vectorweight.com",
                 size=ClusterSize.SMALL,
-                specialized_workloads=["security", "monitoring"]
+                specialized_workloads=frozenset({"security", "monitoring"})
             )
         ],
         enable_cerbos=True,
         enable_mcp=True,
         vector_store_default=VectorStoreType.DISABLED
-    ),
-    
-    "airgapped_enterprise": VectorWaveConfig(
+    )
+
+@cache
+def _build_airgapped_enterprise() -> VectorWaveConfig:
+    return VectorWaveConfig(
         deployment_mode=DeploymentMode.AIRGAPPED_VC,
         source=SourceConfig(
             type=DeploymentMode.AIRGAPPED_VC,
             url="https://git.internal.vectorweight.com",
-            username="${GIT_USERNAME}",
-            token="${GIT_TOKEN}"
+            auth=AuthConfig(
+                username="${GIT_USERNAME}",
+                token="${GIT_TOKEN}"
+            )
         ),
         clusters=[
             ClusterConfig(
@@ -165,4 +395,47 @@ EXAMPLE_CONFIGS = {
         auto_create_repos=False,
         domain="internal.vectorweight.com"
     )
+
+EXAMPLE_CONFIG_BUILDERS: dict[str, Callable[[], VectorWaveConfig]] = {
+    "minimal_dev": _build_minimal_dev,
+    "full_production": _build_full_production,
+    "airgapped_enterprise": _build_airgapped_enterprise,
+}
+
+# Headline metadata for listing presets without instantiating any of them
+EXAMPLE_CONFIG_SUMMARIES: dict[str, dict[str, object]] = {
+    "minimal_dev": {
+        "project_name": "vectorweight-homelab",
+        "environment": "production",
+        "deployment_mode": DeploymentMode.INTERNET.value,
+        "cluster_count": 1,
+    },
+    "full_production": {
+        "project_name": "vectorweight-homelab",
+        "environment": "production",
+        "deployment_mode": DeploymentMode.INTERNET.value,
+        "cluster_count": 4,
+    },
+    "airgapped_enterprise": {
+        "project_name": "vectorweight-homelab",
+        "environment": "production",
+        "deployment_mode": DeploymentMode.AIRGAPPED_VC.value,
+        "cluster_count": 1,
+    },
 }
+
+
+class _ExampleConfigRegistry(Mapping):
+    """Mapping over the example presets that builds each one on first access"""
+
+    def __getitem__(self, name: str) -> VectorWaveConfig:
+        return EXAMPLE_CONFIG_BUILDERS[name]()
+
+    def __iter__(self):
+        return iter(EXAMPLE_CONFIG_BUILDERS)
+
+    def __len__(self) -> int:
+        return len(EXAMPLE_CONFIG_BUILDERS)
+
+
+EXAMPLE_CONFIGS = _ExampleConfigRegistry()
@@ -4,12 +4,18 @@ Enhanced VectorWeight Homelab Generator
 Idempotent, comprehensive deployment automation with airgapped support
 """
 
+import functools
+import hashlib
+import io
 import os
+import string
 import yaml
 import json
 import shutil
 import tempfile
 import subprocess
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 from dataclasses import asdict
@@ -24,6 +30,132 @@ from enhanced_config_schema import (
     SourceConfig, ClusterConfig
 )
 
+# Prefer the libyaml C bindings: charts are dumped several times per
+# cluster and the pure-Python emitter/parser is an order of magnitude
+# slower (same guard as the config loader)
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# orjson serializes to bytes in native code, several times faster than
+# stdlib json; the generator falls back silently when it is absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compound tar suffixes: Path.suffix alone returns only ".gz" for
+# "charts.tar.gz", so detection must look at the last two suffixes
+_TAR_SUFFIXES = frozenset({'.tar', '.tgz', '.tar.gz', '.tar.bz2', '.tar.xz'})
+
+
+def _is_tar_archive(archive_file: Path) -> bool:
+    last = archive_file.suffix.lower()
+    joined = ''.join(archive_file.suffixes[-2:]).lower()
+    return last in _TAR_SUFFIXES or joined in _TAR_SUFFIXES
+
+
+# Script/README templates parsed once at import; per-call work is a
+# single substitute pass over the handful of dynamic fields
+_DEPLOY_SCRIPT_TEMPLATE = string.Template("""#!/bin/bash
+set -e
+
+echo "🚀 Deploying VectorWeight Homelab ($environment)..."
+
+# Deployment mode: $deployment_mode
+# Clusters: $cluster_names
+
+# Bootstrap ArgoCD
+kubectl apply -f orchestration-repo/bootstrap/
+
+# Deploy ApplicationSets
+kubectl apply -f orchestration-repo/applicationsets/
+
+echo "✅ Deployment initiated! Monitor via ArgoCD UI"
+""")
+
+_CLUSTER_README_TEMPLATE = string.Template("""# $title
+
+Configuration for $domain
+
+## Features
+- Size: $size
+- GPU: $gpu
+- Vector Store: $vector_store
+- Cerbos: $cerbos
+
+## Workloads
+$workloads
+""")
+
+
+# Per-cluster output paths resolved once up front; helpers receive the
+# tuple instead of re-deriving each subdirectory through PurePath joins
+_ClusterPaths = namedtuple(
+    '_ClusterPaths', 'root apps bootstrap infra cilium metallb vector cerbos')
+
+
+class _ZeroCopyTarFile(tarfile.TarFile):
+    """TarFile that extracts members with os.copy_file_range
+
+    For seekable uncompressed tars the member payload already sits at a
+    known offset in the archive fd, so the kernel can move it straight
+    to the destination fd without the usual read/write round trip
+    through user space. Anything that breaks that assumption — no
+    fileno, sparse members, missing copy_file_range, a copy error —
+    falls back to the inherited buffered copy.
+    """
+
+    def makefile(self, tarinfo, targetpath):
+        # The fast path needs the archive fd to hold the *decompressed*
+        # byte stream. mode="r:*" auto-detects compression regardless of
+        # the file name, and the decompression wrappers (GzipFile and
+        # friends) expose the underlying compressed fd via fileno() —
+        # copy_file_range at tarinfo.offset_data would then quietly
+        # write garbage. Only the plain buffered reader over the raw
+        # archive qualifies.
+        if (getattr(tarinfo, "sparse", None) is not None
+                or not hasattr(os, "copy_file_range")
+                or not isinstance(self.fileobj, io.BufferedReader)):
+            return super().makefile(tarinfo, targetpath)
+        try:
+            src_fd = self.fileobj.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return super().makefile(tarinfo, targetpath)
+
+        dst_fd = os.open(targetpath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            offset = tarinfo.offset_data
+            remaining = tarinfo.size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining,
+                                            offset_src=offset)
+                if copied == 0:
+                    raise tarfile.ExtractError("unexpected end of data")
+                offset += copied
+                remaining -= copied
+        except OSError:
+            # e.g. EXDEV on older kernels when source and destination
+            # live on different filesystems
+            return super().makefile(tarinfo, targetpath)
+        finally:
+            os.close(dst_fd)
+
+
+def _pick_temp_root() -> Optional[str]:
+    """Prefer RAM-backed tmpfs for scratch space when available
+
+    The workspace holds clones and extracted archives that are written
+    once and re-read immediately; on tmpfs that churn never touches disk.
+    Returns None (tempfile's default root) where /dev/shm is absent.
+    """
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return str(shm)
+    return None
+
+
 class SourceManager:
     """Manages different source types for airgapped deployments"""
     
@@ -32,21 +164,32 @@ class SourceManager:
         self.temp_dir = temp_dir
         self.local_path = temp_dir / "sources"
         self.local_path.mkdir(exist_ok=True)
+
+        # One pooled session for all fetches: keepalive amortizes the
+        # TCP+TLS handshake across archives instead of paying it per GET
+        self._http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=16, pool_maxsize=32, max_retries=3)
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
     
+    # Deployment mode -> fetcher method, resolved with one dict lookup
+    # instead of a compare per mode
+    _FETCHERS = {
+        DeploymentMode.INTERNET: "_fetch_internet_sources",
+        DeploymentMode.AIRGAPPED_VC: "_fetch_vc_sources",
+        DeploymentMode.AIRGAPPED_LOCAL: "_copy_local_sources",
+        DeploymentMode.AIRGAPPED_NETWORK: "_fetch_network_sources",
+        DeploymentMode.AIRGAPPED_ARCHIVE: "_extract_archive_sources",
+    }
+
     def fetch_sources(self) -> Path:
         """Fetch sources based on configuration"""
-        if self.config.type == DeploymentMode.INTERNET:
-            return self._fetch_internet_sources()
-        elif self.config.type == DeploymentMode.AIRGAPPED_VC:
-            return self._fetch_vc_sources()
-        elif self.config.type == DeploymentMode.AIRGAPPED_LOCAL:
-            return self._copy_local_sources()
-        elif self.config.type == DeploymentMode.AIRGAPPED_NETWORK:
-            return self._fetch_network_sources()
-        elif self.config.type == DeploymentMode.AIRGAPPED_ARCHIVE:
-            return self._extract_archive_sources()
-        else:
+        try:
+            fetcher = self._FETCHERS[self.config.type]
+        except KeyError:
             raise ValueError(f"Unsupported deployment mode: {self.config.type}")
+        return getattr(self, fetcher)()
     
     def _fetch_internet_sources(self) -> Path:
         """Use standard internet-based sources"""
@@ -56,21 +199,61 @@ class SourceManager:
         """Clone from version control"""
         repo_path = self.local_path / "repositories"
         if self.config.url:
+            auth = self.config.auth
+            # Only the tree at HEAD is consumed downstream, so a shallow
+            # single-branch clone skips the full history transfer
             git.Repo.clone_from(
                 self.config.url,
                 repo_path,
+                multi_options=["--depth=1", "--single-branch", "--no-tags"],
                 env={
-                    "GIT_USERNAME": self.config.username or "",
-                    "GIT_PASSWORD": self.config.token or self.config.password or ""
+                    "GIT_USERNAME": auth.username or "" if auth else "",
+                    "GIT_PASSWORD": auth.token or auth.password or "" if auth else ""
                 }
             )
         return repo_path
     
     def _copy_local_sources(self) -> Path:
         """Copy from local directory"""
-        if self.config.path and self.config.path.exists():
-            shutil.copytree(self.config.path, self.local_path / "local", dirs_exist_ok=True)
+        if self.config.path_obj and self.config.path_obj.exists():
+            self._copy_tree_fast(self.config.path_obj, self.local_path / "local")
         return self.local_path / "local"
+
+    def _copy_tree_fast(self, src: Path, dst: Path):
+        """Copy a directory tree with scandir and in-kernel file transfer
+
+        scandir entries carry cached type/stat info, avoiding the extra
+        stat per file that copytree pays, and regular file contents move
+        with os.sendfile — kernel to kernel, no userspace bounce buffer.
+        Anything unusual falls back to shutil.copy2.
+        """
+        dst.mkdir(parents=True, exist_ok=True)
+        with os.scandir(src) as entries:
+            for entry in entries:
+                target = dst / entry.name
+                if entry.is_symlink():
+                    if not target.exists():
+                        os.symlink(os.readlink(entry.path), target)
+                elif entry.is_dir(follow_symlinks=False):
+                    self._copy_tree_fast(Path(entry.path), target)
+                else:
+                    self._copy_file_fast(entry, target)
+
+    @staticmethod
+    def _copy_file_fast(entry: os.DirEntry, target: Path):
+        try:
+            size = entry.stat(follow_symlinks=False).st_size
+            with open(entry.path, "rb") as src_f, open(target, "wb") as dst_f:
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst_f.fileno(), src_f.fileno(),
+                                       offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            shutil.copystat(entry.path, target)
+        except OSError:
+            shutil.copy2(entry.path, target)
     
     def _fetch_network_sources(self) -> Path:
         """Fetch from network location"""
@@ -93,32 +276,115 @@ class SourceManager:
         archive_path = self.local_path / "archive"
         archive_path.mkdir(exist_ok=True)
         
-        if self.config.path and self.config.path.exists():
-            self._extract_archive(self.config.path, archive_path)
+        if self.config.path_obj and self.config.path_obj.exists():
+            self._extract_archive(self.config.path_obj, archive_path)
         elif self.config.url:
-            # Download and extract
-            downloaded_archive = self._download_archive(self.config.url)
-            self._extract_archive(downloaded_archive, archive_path)
-        
+            self._stream_extract_from_url(self.config.url, archive_path)
+
         return archive_path
-    
+
+    def _stream_extract_from_url(self, url: str, extract_to: Path):
+        """Download and extract an archive, overlapping the two stages
+
+        Tar archives are extracted straight off the HTTP response stream
+        (tarfile decompresses as bytes arrive), so network transfer and
+        member writes proceed concurrently and no spool file is needed.
+        Zip needs a seekable file, so it downloads first.
+        """
+        name = Path(urlparse(url).path).name
+        if name.endswith(('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')):
+            with self._http.get(url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                with tarfile.open(fileobj=response.raw, mode="r|*") as tar:
+                    tar.extractall(extract_to)
+        else:
+            self._extract_archive(self._download_archive(url), extract_to)
+
+    def _download_from_http(self, url: str, dest_dir: Path) -> Path:
+        """Stream an HTTP(S) download into the destination directory"""
+        target = dest_dir / (Path(urlparse(url).path).name or "download")
+        with self._http.get(url, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            with open(target, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=self._ARCHIVE_BUFFER_SIZE)
+        return target
+
+    def _download_archive(self, url: str) -> Path:
+        """Download an archive to the working directory for extraction"""
+        return self._download_from_http(url, self.temp_dir)
+
+    def _mount_network_path(self, url: str, dest: Path):
+        """Mount a network filesystem source (SMB/NFS/SSH)"""
+        raise ValueError(f"Network filesystem sources are not yet supported: {url}")
+
+    # Archive reads go through a 2 MiB buffer: the stdlib default (8 KiB)
+    # leaves large chart-bundle extraction syscall-bound
+    _ARCHIVE_BUFFER_SIZE = 2 * 1024 * 1024
+
+    def _buffered_archive_reader(self, archive_file: Path) -> io.BufferedReader:
+        return io.BufferedReader(open(archive_file, "rb", buffering=0),
+                                 buffer_size=self._ARCHIVE_BUFFER_SIZE)
+
     def _extract_archive(self, archive_file: Path, extract_to: Path):
         """Extract various archive formats"""
-        if archive_file.suffix in ['.tar', '.tar.gz', '.tgz']:
-            with tarfile.open(archive_file) as tar:
-                tar.extractall(extract_to)
-        elif archive_file.suffix == '.zip':
-            with zipfile.ZipFile(archive_file) as zip_file:
-                zip_file.extractall(extract_to)
+        if _is_tar_archive(archive_file):
+            # Zero-copy extraction only applies to plain tars: compressed
+            # streams expose the compressed bytes through fileno(), so
+            # they keep the regular decompress-and-copy path
+            tar_cls = (_ZeroCopyTarFile if archive_file.suffix.lower() == '.tar'
+                       else tarfile.TarFile)
+            with self._buffered_archive_reader(archive_file) as buf:
+                with tar_cls.open(fileobj=buf, mode="r:*") as tar:
+                    tar.extractall(extract_to)
+        elif archive_file.suffix.lower() == '.zip':
+            self._extract_zip(archive_file, extract_to)
         else:
             raise ValueError(f"Unsupported archive format: {archive_file.suffix}")
 
+    def _extract_zip(self, archive_file: Path, extract_to: Path):
+        """Extract a zip archive, fanning members out across threads
+
+        Zip members are independently compressed and indexed, so each
+        worker opens its own ZipFile handle (member reads share no state
+        that way) and extracts a slice of the name list; zlib releases
+        the GIL while inflating. Small archives skip the pool.
+        """
+        with self._buffered_archive_reader(archive_file) as buf:
+            with zipfile.ZipFile(buf) as zip_file:
+                names = zip_file.namelist()
+                if len(names) < 8:
+                    zip_file.extractall(extract_to)
+                    return
+
+        workers = min(os.cpu_count() or 1, 8)
+
+        def extract_slice(member_names):
+            with zipfile.ZipFile(archive_file) as zf:
+                for member in member_names:
+                    zf.extract(member, extract_to)
+
+        slices = [names[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(extract_slice, slices))
+
 class CerbosIntegration:
     """Handles Cerbos authorization engine integration"""
-    
+
+    _config_cache: Optional[Dict] = None
+
     @staticmethod
     def generate_cerbos_config(clusters: List[ClusterConfig]) -> Dict:
-        """Generate Cerbos configuration"""
+        """Generate Cerbos configuration
+
+        The configuration is independent of the cluster list today, so it
+        is built once and reused; callers treat it as read-only.
+        """
+        if CerbosIntegration._config_cache is None:
+            CerbosIntegration._config_cache = CerbosIntegration._build_config()
+        return CerbosIntegration._config_cache
+
+    @staticmethod
+    def _build_config() -> Dict:
         return {
             "cerbos": {
                 "enabled": True,
@@ -151,10 +417,19 @@ class VectorStoreManager:
     
     @staticmethod
     def generate_vector_store_config(store_type: VectorStoreType, cluster_config: ClusterConfig) -> Dict:
-        """Generate vector store configuration"""
+        """Generate vector store configuration
+
+        Only the cluster size feeds the output, so results are memoized
+        per (store type, size); callers treat them as read-only.
+        """
+        return VectorStoreManager._config_for(store_type, cluster_config.size)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _config_for(store_type: VectorStoreType, size: ClusterSize) -> Dict:
         if store_type == VectorStoreType.DISABLED:
             return {}
-        
+
         base_config = {
             "enabled": True,
             "namespace": "vector-stores",
@@ -168,7 +443,7 @@ class VectorStoreManager:
                 **base_config,
                 "weaviate": {
                     "provider": "weaviate",
-                    "replicas": 3 if cluster_config.size != ClusterSize.MINIMAL else 1,
+                    "replicas": 3 if size != ClusterSize.MINIMAL else 1,
                     "storage_size": "500Gi",
                     "memory_allocation": "32Gi",
                     "config": {
@@ -234,11 +509,50 @@ class EnhancedVectorWeightGenerator:
     
     def __init__(self, config: VectorWaveConfig):
         self.config = config
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = Path(tempfile.mkdtemp(dir=_pick_temp_root()))
         self.source_manager = SourceManager(config.source, self.temp_dir) if config.source else None
         self.helm_manager = EnhancedHelmManager(self.source_manager) if self.source_manager else None
         self.output_path = Path(f"./vectorweight-homelab-{config.environment}")
-        
+
+        # asdict deep-copies the whole dataclass tree, so each cluster is
+        # converted at most once per run and the snapshot reused by any
+        # stage that needs a plain-dict view (hashing, manifest emission)
+        self._cluster_snapshots: Dict[str, Dict] = {}
+
+    def _cluster_snapshot(self, cluster: ClusterConfig) -> Dict:
+        """Return the memoized plain-dict view of a cluster config"""
+        snapshot = self._cluster_snapshots.get(cluster.name)
+        if snapshot is None:
+            snapshot = self._cluster_snapshots[cluster.name] = asdict(cluster)
+        return snapshot
+
+    def _cluster_content_hash(self, cluster: ClusterConfig) -> str:
+        """Hash the inputs that shape a cluster's output tree
+
+        blake2b over the canonical JSON form of the cluster snapshot
+        plus the global flags that leak into per-cluster output; used
+        to skip regeneration of clusters whose inputs are unchanged.
+        """
+        def _default(value):
+            if isinstance(value, (set, frozenset)):
+                return sorted(value)
+            return str(value)
+
+        # Every global setting consumed by the per-cluster generators
+        # belongs here: use_vms steers the cilium overrides and the IP
+        # pool bounds the metallb address range
+        document = [self._cluster_snapshot(cluster),
+                    self.config.enable_cerbos, self.config.environment,
+                    self.config.use_vms,
+                    self.config.ip_pool_start, self.config.ip_pool_end]
+        if orjson is not None:
+            payload = orjson.dumps(document, option=orjson.OPT_SORT_KEYS,
+                                   default=_default)
+        else:
+            payload = json.dumps(document, sort_keys=True,
+                                 default=_default).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
     def generate_all(self) -> None:
         """Generate complete homelab deployment - idempotent"""
         print(f"🚀 Generating VectorWeight Homelab ({self.config.environment})...")
@@ -255,10 +569,21 @@ class EnhancedVectorWeightGenerator:
         if self.config.auto_create_repos:
             self._ensure_repositories_exist()
         
-        # Generate cluster configurations
-        for cluster in self.config.clusters:
-            print(f"📁 Generating {cluster.name}...")
-            self._generate_cluster(cluster)
+        # Generate cluster configurations. Each cluster writes its own
+        # directory tree and the work is mkdir/open/yaml-dump dominated —
+        # filesystem syscalls that release the GIL — so threads give the
+        # overlap without process spawn or config pickling. A single
+        # cluster is not worth the pool.
+        if len(self.config.clusters) > 1:
+            workers = min(8, len(self.config.clusters))
+            for cluster in self.config.clusters:
+                print(f"📁 Generating {cluster.name}...")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self._generate_cluster, self.config.clusters))
+        else:
+            for cluster in self.config.clusters:
+                print(f"📁 Generating {cluster.name}...")
+                self._generate_cluster(cluster)
         
         # Generate orchestration
         print("🎯 Generating orchestration...")
@@ -279,65 +604,96 @@ class EnhancedVectorWeightGenerator:
                        for cluster in self.config.clusters]
         repos_needed.append(f"{self.config.github_org}/orchestration-repo")
         
-        for repo in repos_needed:
+        # Each gh invocation is fork+exec plus a round trip to the API;
+        # the creations are independent, so run them concurrently and
+        # print results as they complete (in submission order)
+        def create_repo(repo: str) -> str:
             try:
                 # Use GitHub CLI if available
                 subprocess.run([
-                    "gh", "repo", "create", repo, 
+                    "gh", "repo", "create", repo,
                     "--public", "--description", f"VectorWeight {repo} configuration"
                 ], check=True, capture_output=True)
-                print(f"✅ Created repository: {repo}")
+                return f"✅ Created repository: {repo}"
             except subprocess.CalledProcessError:
-                print(f"ℹ️  Repository {repo} already exists or creation failed")
+                return f"ℹ️  Repository {repo} already exists or creation failed"
+
+        with ThreadPoolExecutor(max_workers=min(8, len(repos_needed))) as executor:
+            for line in executor.map(create_repo, repos_needed):
+                print(line)
     
     def _generate_cluster(self, cluster: ClusterConfig):
         """Generate individual cluster configuration"""
         cluster_path = self.output_path / cluster.name
-        cluster_path.mkdir(exist_ok=True)
-        
-        # Directory structure
-        (cluster_path / "apps").mkdir(exist_ok=True)
-        (cluster_path / "infrastructure").mkdir(exist_ok=True)
-        (cluster_path / "bootstrap").mkdir(exist_ok=True)
-        
+        infra_path = cluster_path / "infrastructure"
+        paths = _ClusterPaths(
+            root=cluster_path,
+            apps=cluster_path / "apps",
+            bootstrap=cluster_path / "bootstrap",
+            infra=infra_path,
+            cilium=infra_path / "cilium",
+            metallb=infra_path / "metallb",
+            vector=infra_path / "vector-store",
+            cerbos=infra_path / "cerbos",
+        )
+
+        # Idempotency: a marker from the previous run holds the hash of
+        # this cluster's inputs — when it matches, every mkdir and yaml
+        # dump below would reproduce what is already on disk
+        cfg_hash = self._cluster_content_hash(cluster)
+        cache_marker = cluster_path / ".cache"
+        try:
+            if cache_marker.read_text() == cfg_hash:
+                print(f"⏭️  {cluster.name} is up to date, skipping")
+                return
+        except OSError:
+            pass
+
+        # Create the whole directory structure in one sweep; makedirs
+        # with parents covers cluster_path and infrastructure implicitly,
+        # so each leaf costs one mkdir instead of a call per level
+        dirs = [paths.apps, paths.bootstrap, paths.cilium, paths.metallb]
+        if cluster.vector_store != VectorStoreType.DISABLED:
+            dirs.append(paths.vector)
+        if cluster.cerbos_enabled or self.config.enable_cerbos:
+            dirs.append(paths.cerbos)
+        for d in dirs:
+            d.mkdir(parents=True, exist_ok=True)
+
         # Generate base infrastructure
-        self._generate_base_infrastructure(cluster, cluster_path)
-        
+        self._generate_base_infrastructure(cluster, paths)
+
         # Generate vector stores if enabled
         if cluster.vector_store != VectorStoreType.DISABLED:
-            self._generate_vector_store(cluster, cluster_path)
-        
+            self._generate_vector_store(cluster, paths)
+
         # Generate Cerbos if enabled
         if cluster.cerbos_enabled or self.config.enable_cerbos:
-            self._generate_cerbos_config(cluster, cluster_path)
-        
+            self._generate_cerbos_config(cluster, paths)
+
         # Generate applications
-        self._generate_cluster_applications(cluster, cluster_path)
-        
+        self._generate_cluster_applications(cluster, paths.root)
+
         # Generate README
-        self._generate_cluster_readme(cluster, cluster_path)
-    
-    def _generate_base_infrastructure(self, cluster: ClusterConfig, cluster_path: Path):
+        self._generate_cluster_readme(cluster, paths.root)
+
+        cache_marker.write_text(cfg_hash)
+
+    def _generate_base_infrastructure(self, cluster: ClusterConfig, paths: _ClusterPaths):
         """Generate base infrastructure components"""
-        infra_path = cluster_path / "infrastructure"
-        
         # CNI (Cilium)
-        cilium_path = infra_path / "cilium"
-        cilium_path.mkdir(exist_ok=True)
-        
         cilium_values = self._get_cluster_size_values(cluster.size, "cilium")
         if not self.config.use_vms:
-            cilium_values.update({
+            # The size table is shared; copy before adding overrides
+            cilium_values = {
+                **cilium_values,
                 "hostNetwork": True,
                 "kubeProxyReplacement": "strict"
-            })
-        
-        self._write_helm_chart(cilium_path, "cilium", "1.17.4", cilium_values)
+            }
         
+        self._write_helm_chart(paths.cilium, "cilium", "1.17.4", cilium_values)
+
         # Load Balancer (MetalLB)
-        metallb_path = infra_path / "metallb"
-        metallb_path.mkdir(exist_ok=True)
-        
         metallb_values = {
             "configInline": {
                 "address-pools": [{
@@ -348,41 +704,55 @@ class EnhancedVectorWeightGenerator:
             }
         }
         
-        self._write_helm_chart(metallb_path, "metallb", "6.4.18", metallb_values)
-    
-    def _generate_vector_store(self, cluster: ClusterConfig, cluster_path: Path):
+        self._write_helm_chart(paths.metallb, "metallb", "6.4.18", metallb_values)
+
+    def _generate_vector_store(self, cluster: ClusterConfig, paths: _ClusterPaths):
         """Generate vector store configuration"""
-        vs_path = cluster_path / "infrastructure" / "vector-store"
-        vs_path.mkdir(exist_ok=True)
-        
         vs_config = VectorStoreManager.generate_vector_store_config(
             cluster.vector_store, cluster
         )
         
         # Write vector store Helm chart
         if cluster.vector_store == VectorStoreType.WEAVIATE:
-            self._write_helm_chart(vs_path, "weaviate", "25.2.3", vs_config.get("weaviate", {}))
+            self._write_helm_chart(paths.vector, "weaviate", "25.2.3", vs_config.get("weaviate", {}))
         elif cluster.vector_store == VectorStoreType.IN_MEMORY:
-            self._write_helm_chart(vs_path, "chroma", "latest", vs_config.get("chroma", {}))
-    
-    def _generate_cerbos_config(self, cluster: ClusterConfig, cluster_path: Path):
+            self._write_helm_chart(paths.vector, "chroma", "latest", vs_config.get("chroma", {}))
+
+    def _generate_cerbos_config(self, cluster: ClusterConfig, paths: _ClusterPaths):
         """Generate Cerbos authorization configuration"""
-        cerbos_path = cluster_path / "infrastructure" / "cerbos"
-        cerbos_path.mkdir(exist_ok=True)
-        
         cerbos_config = CerbosIntegration.generate_cerbos_config([cluster])
-        self._write_helm_chart(cerbos_path, "cerbos", "0.30.0", cerbos_config.get("cerbos", {}))
+        self._write_helm_chart(paths.cerbos, "cerbos", "0.30.0", cerbos_config.get("cerbos", {}))
     
+    # Component sizing by cluster size, built once instead of a fresh
+    # dict literal per (cluster, component) call. Shared and read-only:
+    # callers copy before mutating.
+    _SIZE_CONFIGS = {
+        ClusterSize.MINIMAL: {"replicas": 1, "resources": {"cpu": "100m", "memory": "128Mi"}},
+        ClusterSize.SMALL: {"replicas": 2, "resources": {"cpu": "200m", "memory": "256Mi"}},
+        ClusterSize.MEDIUM: {"replicas": 3, "resources": {"cpu": "500m", "memory": "512Mi"}},
+        ClusterSize.LARGE: {"replicas": 5, "resources": {"cpu": "1", "memory": "1Gi"}}
+    }
+
     def _get_cluster_size_values(self, size: ClusterSize, component: str) -> Dict:
-        """Get component values based on cluster size"""
-        size_configs = {
-            ClusterSize.MINIMAL: {"replicas": 1, "resources": {"cpu": "100m", "memory": "128Mi"}},
-            ClusterSize.SMALL: {"replicas": 2, "resources": {"cpu": "200m", "memory": "256Mi"}},
-            ClusterSize.MEDIUM: {"replicas": 3, "resources": {"cpu": "500m", "memory": "512Mi"}},
-            ClusterSize.LARGE: {"replicas": 5, "resources": {"cpu": "1", "memory": "1Gi"}}
-        }
-        return size_configs.get(size, size_configs[ClusterSize.SMALL])
+        """Get component values based on cluster size (shared, read-only)"""
+        return self._SIZE_CONFIGS.get(size, self._SIZE_CONFIGS[ClusterSize.SMALL])
     
+    def _write_yaml(self, path, obj: Dict, dir_fd: Optional[int] = None):
+        """Stream a YAML document straight to disk
+
+        The emitter writes into the file handle as it serializes, so no
+        intermediate string of the whole document is ever materialized.
+        With dir_fd the open is resolved relative to an already-open
+        directory, skipping the full path walk from the process cwd.
+        """
+        opener = None
+        if dir_fd is not None:
+            opener = lambda p, flags: os.open(p, flags, dir_fd=dir_fd)
+        # 64 KiB buffer: typical chart documents fit entirely, so the
+        # emitter never flushes mid-document and each file costs one write
+        with open(path, "w", buffering=65536, opener=opener) as f:
+            yaml.dump(obj, f, Dumper=SafeDumper, default_flow_style=False)
+
     def _write_helm_chart(self, chart_path: Path, chart_name: str, version: str, values: Dict):
         """Write Helm chart files"""
         # Chart.yaml
@@ -396,23 +766,27 @@ class EnhancedVectorWeightGenerator:
                 "repository": self._get_chart_repository(chart_name)
             }]
         }
-        
-        with open(chart_path / "Chart.yaml", "w") as f:
-            yaml.dump(chart_yaml, f, default_flow_style=False)
-        
-        # values.yaml
-        with open(chart_path / "values.yaml", "w") as f:
-            yaml.dump(values, f, default_flow_style=False)
+
+        # Resolve the chart directory once and write both files relative
+        # to the open fd — one path walk per chart instead of per file
+        chart_fd = os.open(chart_path, os.O_DIRECTORY)
+        try:
+            self._write_yaml("Chart.yaml", chart_yaml, dir_fd=chart_fd)
+            self._write_yaml("values.yaml", values, dir_fd=chart_fd)
+        finally:
+            os.close(chart_fd)
     
+    # Chart name -> repository URL, built once instead of per lookup
+    _CHART_REPOSITORIES = {
+        "cilium": "https://helm.cilium.io/",
+        "metallb": "oci://registry-1.docker.io/bitnamicharts",
+        "weaviate": "https://weaviate.github.io/weaviate-helm",
+        "cerbos": "https://cerbos.dev/helm-charts"
+    }
+
     def _get_chart_repository(self, chart_name: str) -> str:
         """Get repository URL for chart"""
-        repo_map = {
-            "cilium": "https://helm.cilium.io/",
-            "metallb": "oci://registry-1.docker.io/bitnamicharts",
-            "weaviate": "https://weaviate.github.io/weaviate-helm",
-            "cerbos": "https://cerbos.dev/helm-charts"
-        }
-        return repo_map.get(chart_name, "https://charts.bitnami.com/bitnami")
+        return self._CHART_REPOSITORIES.get(chart_name, "https://charts.bitnami.com/bitnami")
     
     def _generate_cluster_applications(self, cluster: ClusterConfig, cluster_path: Path):
         """Generate Argo CD Application manifests"""
@@ -426,45 +800,29 @@ class EnhancedVectorWeightGenerator:
     
     def _generate_deployment_scripts(self):
         """Generate deployment automation scripts"""
-        deploy_script = f"""#!/bin/bash
-set -e
-
-echo "🚀 Deploying VectorWeight Homelab ({self.config.environment})..."
-
-# Deployment mode: {self.config.deployment_mode.value}
-# Clusters: {', '.join([c.name for c in self.config.clusters])}
-
-# Bootstrap ArgoCD
-kubectl apply -f orchestration-repo/bootstrap/
-
-# Deploy ApplicationSets
-kubectl apply -f orchestration-repo/applicationsets/
+        deploy_script = _DEPLOY_SCRIPT_TEMPLATE.substitute(
+            environment=self.config.environment,
+            deployment_mode=self.config.deployment_mode.value,
+            cluster_names=', '.join(c.name for c in self.config.clusters),
+        )
 
-echo "✅ Deployment initiated! Monitor via ArgoCD UI"
-"""
-        
         script_path = self.output_path / "deploy.sh"
-        script_path.write_text(deploy_script)
+        script_path.write_bytes(deploy_script.encode("utf-8"))
         script_path.chmod(0o755)
-    
+
     def _generate_cluster_readme(self, cluster: ClusterConfig, cluster_path: Path):
         """Generate cluster-specific README"""
-        readme_content = f"""# {cluster.name.title()}
-
-Configuration for {cluster.domain}
-
-## Features
-- Size: {cluster.size.value}
-- GPU: {'✅' if cluster.gpu_enabled else '❌'}
-- Vector Store: {cluster.vector_store.value}
-- Cerbos: {'✅' if cluster.cerbos_enabled else '❌'}
+        readme_content = _CLUSTER_README_TEMPLATE.substitute(
+            title=cluster.name.title(),
+            domain=cluster.domain,
+            size=cluster.size.value,
+            gpu='✅' if cluster.gpu_enabled else '❌',
+            vector_store=cluster.vector_store.value,
+            cerbos='✅' if cluster.cerbos_enabled else '❌',
+            workloads='\n'.join(f'- {w}' for w in sorted(cluster.specialized_workloads)),
+        )
 
-## Workloads
-{chr(10).join(f'- {w}' for w in cluster.specialized_workloads)}
-"""
-        
-        with open(cluster_path / "README.md", "w") as f:
-            f.write(readme_content)
+        (cluster_path / "README.md").write_bytes(readme_content.encode("utf-8"))
     
     def _print_next_steps(self):
         """Print deployment next steps"""
@@ -482,8 +840,15 @@ if __name__ == "__main__":
     
     if len(sys.argv) > 1:
         config_file = sys.argv[1]
-        with open(config_file) as f:
-            config_data = yaml.safe_load(f)
+        # JSON configs skip the YAML parser entirely — JSON is valid
+        # YAML but roughly an order of magnitude slower to parse that way
+        if config_file.endswith(".json"):
+            with open(config_file, "rb") as f:
+                raw = f.read()
+            config_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        else:
+            with open(config_file) as f:
+                config_data = yaml.load(f, Loader=SafeLoader)
         config = VectorWaveConfig(**config_data)
     else:
         # Use minimal dev example
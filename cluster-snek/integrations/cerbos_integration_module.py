@@ -4,17 +4,29 @@ Cerbos Authorization Integration Module
 Enterprise-grade authorization engine integration for Kubernetes environments
 """
 
+import copy
+import functools
+import json
 import logging
-from typing import Dict, List, Optional, Any
+import sys
+import types
+from typing import Dict, List, Literal, Optional, Any
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+# Helm and kubectl accept JSON values interchangeably with YAML; when a
+# consumer opts in, orjson emits policy documents in native code
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from vectorweight.config.schema import ClusterConfiguration, ClusterSize
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CerbosConfiguration:
     """Cerbos deployment configuration parameters"""
     replicas: int
@@ -28,7 +40,7 @@ class CerbosConfiguration:
     jwt_verification_enabled: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PolicyDefinition:
     """Cerbos policy definition structure"""
     resource_type: str
@@ -38,70 +50,459 @@ class PolicyDefinition:
     derived_roles: Optional[List[str]] = None
 
 
-class CerbosIntegrationManager:
-    """Central manager for Cerbos authorization engine integration"""
-    
-    def __init__(self):
-        self.default_policies = self._initialize_default_policies()
-        self.jwt_issuers = self._initialize_jwt_issuers()
-    
-    def _initialize_default_policies(self) -> List[PolicyDefinition]:
-        """Initialize default policy definitions for VectorWeight deployment"""
-        return [
-            PolicyDefinition(
-                resource_type="vector_stores",
-                actions=["read", "write", "query", "index"],
-                conditions=[
-                    "request.user.department == 'ai-research'",
-                    "request.resource.classification <= 'internal'"
-                ],
-                roles=["data-scientist", "ai-engineer", "researcher"]
-            ),
-            PolicyDefinition(
-                resource_type="ai_models",
-                actions=["deploy", "inference", "train", "evaluate"],
-                conditions=[
-                    "request.user.role in ['ml-engineer', 'ai-architect']",
-                    "request.resource.security_scan == 'passed'"
-                ],
-                roles=["ml-engineer", "ai-architect", "model-deployer"]
-            ),
-            PolicyDefinition(
-                resource_type="kubernetes_resources",
-                actions=["create", "read", "update", "delete"],
-                conditions=[
-                    "request.user.namespace_access contains request.resource.namespace",
-                    "request.resource.sensitive != true"
+# Default policies and JWT issuers are literal data that never varies
+# between managers, so they are built once at import; __init__ just
+# binds references. Shared and read-only.
+_DEFAULT_POLICIES: tuple = (
+    PolicyDefinition(
+        resource_type="vector_stores",
+        actions=["read", "write", "query", "index"],
+        conditions=[
+            "request.user.department == 'ai-research'",
+            "request.resource.classification <= 'internal'"
+        ],
+        roles=["data-scientist", "ai-engineer", "researcher"]
+    ),
+    PolicyDefinition(
+        resource_type="ai_models",
+        actions=["deploy", "inference", "train", "evaluate"],
+        conditions=[
+            "request.user.role in ['ml-engineer', 'ai-architect']",
+            "request.resource.security_scan == 'passed'"
+        ],
+        roles=["ml-engineer", "ai-architect", "model-deployer"]
+    ),
+    PolicyDefinition(
+        resource_type="kubernetes_resources",
+        actions=["create", "read", "update", "delete"],
+        conditions=[
+            "request.user.namespace_access contains request.resource.namespace",
+            "request.resource.sensitive != true"
+        ],
+        roles=["developer", "operator", "admin"],
+        derived_roles=["namespace-admin", "cluster-viewer"]
+    ),
+    PolicyDefinition(
+        resource_type="monitoring_data",
+        actions=["view", "export", "analyze"],
+        conditions=[
+            "request.user.security_clearance >= request.resource.classification",
+            "request.time.hour >= 8 && request.time.hour <= 18"
+        ],
+        roles=["security-analyst", "site-reliability-engineer", "platform-engineer"]
+    )
+)
+
+# Policy files have a fixed shape — only resource, actions, roles and
+# conditions vary — so they are assembled from string templates instead
+# of building a nested dict and walking it through the YAML emitter
+_POLICY_HEADER_TEMPLATE = (
+    "apiVersion: api.cerbos.dev/v1\n"
+    "resourcePolicy:\n"
+    "  version: default\n"
+    "  resource: {resource}\n"
+    "  rules:\n"
+)
+
+_POLICY_RULE_TEMPLATE = (
+    "  - actions: [{action}]\n"
+    "    effect: EFFECT_ALLOW\n"
+    "    roles: [{roles}]\n"
+    "{derived_roles}"
+    "    condition:\n"
+    "      match:\n"
+    "        all:\n"
+    "          of:\n"
+    "{expressions}\n"
+)
+
+
+def _yaml_quote(value: str) -> str:
+    """Double-quote a scalar so arbitrary expressions stay valid YAML"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _dump_json(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _policy_document(policy: PolicyDefinition) -> Dict[str, Any]:
+    """Build the resourcePolicy document structure for JSON emission"""
+    rules = []
+    for action in policy.actions:
+        rule = {
+            "actions": [action],
+            "effect": "EFFECT_ALLOW",
+            "roles": list(policy.roles),
+            "condition": {
+                "match": {
+                    "all": {
+                        "of": [{"expr": condition} for condition in policy.conditions]
+                    }
+                }
+            }
+        }
+        if policy.derived_roles:
+            rule["derivedRoles"] = list(policy.derived_roles)
+        rules.append(rule)
+
+    return {
+        "apiVersion": "api.cerbos.dev/v1",
+        "resourcePolicy": {
+            "version": "default",
+            "resource": policy.resource_type,
+            "rules": rules
+        }
+    }
+
+
+@functools.lru_cache(maxsize=2)
+def _default_policy_files(output_format: str = "yaml") -> Dict[str, str]:
+    """Rendered default policy files, built once per format on first use
+
+    The default policies are module constants, so the rendered output
+    never varies; every call after the first is a pointer return. The
+    dict is shared — callers treat it as read-only.
+    """
+    if output_format == "json":
+        return {
+            f"{policy.resource_type}_policy.json": _dump_json(_policy_document(policy))
+            for policy in _DEFAULT_POLICIES
+        }
+    return {
+        f"{policy.resource_type}_policy.yaml": _render_policy_file(policy)
+        for policy in _DEFAULT_POLICIES
+    }
+
+
+def _render_policy_file(policy: PolicyDefinition) -> str:
+    """Render one resourcePolicy document from the templates"""
+    roles = ", ".join(_yaml_quote(role) for role in policy.roles)
+    derived_roles = ""
+    if policy.derived_roles:
+        derived_roles = "    derivedRoles: [{}]\n".format(
+            ", ".join(_yaml_quote(role) for role in policy.derived_roles))
+    expressions = "\n".join(
+        f"          - expr: {_yaml_quote(condition)}"
+        for condition in policy.conditions)
+
+    rules = "".join(
+        _POLICY_RULE_TEMPLATE.format(
+            action=_yaml_quote(action),
+            roles=roles,
+            derived_roles=derived_roles,
+            expressions=expressions,
+        )
+        for action in policy.actions)
+
+    return _POLICY_HEADER_TEMPLATE.format(resource=policy.resource_type) + rules
+
+
+_JWT_ISSUERS: tuple = (
+    {
+        "issuer": "https://auth.vectorweight.com",
+        "audience": "vectorweight-services",
+        "jwks_url": "https://auth.vectorweight.com/.well-known/jwks.json"
+    },
+    {
+        "issuer": "https://keycloak.vectorweight.internal",
+        "audience": "kubernetes-api",
+        "jwks_url": "https://keycloak.vectorweight.internal/auth/realms/vectorweight/protocol/openid_connect/certs"
+    }
+)
+
+
+# Strings shared by every size entry are interned so the four
+# configurations reference one object each and comparisons are
+# pointer-equality
+_AUTHORIZATION_NAMESPACE = sys.intern("authorization")
+_POLICY_REPOSITORY_URL = sys.intern("https://github.com/vectorweight/cerbos-policies")
+
+# Size tables built once at import; lookups are plain dict probes with
+# a pre-bound SMALL fallback
+_SIZE_CONFIGURATIONS: Dict[ClusterSize, CerbosConfiguration] = {
+    ClusterSize.MINIMAL: CerbosConfiguration(
+        replicas=1,
+        namespace=_AUTHORIZATION_NAMESPACE,
+        storage_enabled=True,
+        storage_size="10Gi",
+        audit_enabled=False,
+        postgres_enabled=False,
+        high_availability=False,
+        policy_repository=_POLICY_REPOSITORY_URL,
+        jwt_verification_enabled=True
+    ),
+    ClusterSize.SMALL: CerbosConfiguration(
+        replicas=2,
+        namespace=_AUTHORIZATION_NAMESPACE,
+        storage_enabled=True,
+        storage_size="25Gi",
+        audit_enabled=True,
+        postgres_enabled=True,
+        high_availability=True,
+        policy_repository=_POLICY_REPOSITORY_URL,
+        jwt_verification_enabled=True
+    ),
+    ClusterSize.MEDIUM: CerbosConfiguration(
+        replicas=3,
+        namespace=_AUTHORIZATION_NAMESPACE,
+        storage_enabled=True,
+        storage_size="50Gi",
+        audit_enabled=True,
+        postgres_enabled=True,
+        high_availability=True,
+        policy_repository=_POLICY_REPOSITORY_URL,
+        jwt_verification_enabled=True
+    ),
+    ClusterSize.LARGE: CerbosConfiguration(
+        replicas=5,
+        namespace=_AUTHORIZATION_NAMESPACE,
+        storage_enabled=True,
+        storage_size="100Gi",
+        audit_enabled=True,
+        postgres_enabled=True,
+        high_availability=True,
+        policy_repository=_POLICY_REPOSITORY_URL,
+        jwt_verification_enabled=True
+    )
+}
+
+_DEFAULT_SIZE_CONFIGURATION = _SIZE_CONFIGURATIONS[ClusterSize.SMALL]
+
+
+def _base_configuration_for(cluster_size: ClusterSize) -> CerbosConfiguration:
+    """Base configuration parameters for a cluster size"""
+    return _SIZE_CONFIGURATIONS.get(cluster_size, _DEFAULT_SIZE_CONFIGURATION)
+
+
+# Resource requirements built once at import with a pre-bound SMALL
+# fallback. Plain dicts rather than mapping proxies because generated
+# configurations embedding them are deep-copied into the cache, and
+# proxies are not deep-copyable; shared and read-only by convention.
+_RESOURCE_REQUIREMENTS: Dict[ClusterSize, Dict[str, Any]] = {
+    ClusterSize.MINIMAL: {
+        "requests": {"memory": "256Mi", "cpu": "100m"},
+        "limits": {"memory": "512Mi", "cpu": "250m"}
+    },
+    ClusterSize.SMALL: {
+        "requests": {"memory": "512Mi", "cpu": "250m"},
+        "limits": {"memory": "1Gi", "cpu": "500m"}
+    },
+    ClusterSize.MEDIUM: {
+        "requests": {"memory": "1Gi", "cpu": "500m"},
+        "limits": {"memory": "2Gi", "cpu": "1"}
+    },
+    ClusterSize.LARGE: {
+        "requests": {"memory": "2Gi", "cpu": "1"},
+        "limits": {"memory": "4Gi", "cpu": "2"}
+    }
+}
+
+_DEFAULT_RESOURCE_REQUIREMENTS = _RESOURCE_REQUIREMENTS[ClusterSize.SMALL]
+
+
+def _resource_requirements_for(cluster_size: ClusterSize) -> Dict[str, Any]:
+    """Resource requirements for a cluster size (shared, read-only)"""
+    return _RESOURCE_REQUIREMENTS.get(cluster_size, _DEFAULT_RESOURCE_REQUIREMENTS)
+
+
+# Sub-generator output that is static (or static up to a name/domain
+# string) lives here as templates built once at import; the generators
+# deep-copy on read — still far cheaper than re-evaluating the literals
+# — and patch in the few per-cluster fields
+_SECURITY_CONFIGURATION: Dict[str, Any] = {
+    "pod_security_context": {
+        "run_as_non_root": True,
+        "run_as_user": 65534,
+        "run_as_group": 65534,
+        "fs_group": 65534,
+        "seccomp_profile": {
+            "type": "RuntimeDefault"
+        }
+    },
+    "container_security_context": {
+        "allow_privilege_escalation": False,
+        "read_only_root_filesystem": True,
+        "capabilities": {
+            "drop": ["ALL"]
+        }
+    },
+    "network_policy": {
+        "enabled": True,
+        "ingress": [
+            {
+                "from": [
+                    {"namespaceSelector": {"matchLabels": {"name": "vector-stores"}}},
+                    {"namespaceSelector": {"matchLabels": {"name": "ai-workloads"}}},
+                    {"namespaceSelector": {"matchLabels": {"name": "applications"}}},
+                    {"namespaceSelector": {"matchLabels": {"name": "istio-system"}}}
                 ],
-                roles=["developer", "operator", "admin"],
-                derived_roles=["namespace-admin", "cluster-viewer"]
-            ),
-            PolicyDefinition(
-                resource_type="monitoring_data",
-                actions=["view", "export", "analyze"],
-                conditions=[
-                    "request.user.security_clearance >= request.resource.classification",
-                    "request.time.hour >= 8 && request.time.hour <= 18"
+                "ports": [
+                    {"protocol": "TCP", "port": 3593},  # Cerbos gRPC
+                    {"protocol": "TCP", "port": 3592}   # Cerbos HTTP
+                ]
+            }
+        ],
+        "egress": [
+            {
+                "to": [
+                    {"namespaceSelector": {"matchLabels": {"name": "authorization"}}}
                 ],
-                roles=["security-analyst", "site-reliability-engineer", "platform-engineer"]
-            )
+                "ports": [
+                    {"protocol": "TCP", "port": 5432}  # PostgreSQL
+                ]
+            },
+            {
+                "to": [],
+                "ports": [
+                    {"protocol": "TCP", "port": 443},  # HTTPS for JWT verification
+                    {"protocol": "TCP", "port": 53},   # DNS
+                    {"protocol": "UDP", "port": 53}    # DNS
+                ]
+            }
         ]
-    
-    def _initialize_jwt_issuers(self) -> List[Dict[str, str]]:
-        """Initialize JWT issuer configurations for external identity providers"""
-        return [
+    }
+}
+
+_MONITORING_CONFIGURATION_TEMPLATE: Dict[str, Any] = {
+    "metrics": {
+        "enabled": True,
+        "port": 8080,
+        "path": "/metrics",
+        "service_monitor": {
+            "enabled": True,
+            "namespace": "monitoring",
+            "labels": {
+                "app.kubernetes.io/name": "cerbos",
+                # app.kubernetes.io/instance is patched per cluster
+            }
+        }
+    },
+    "tracing": {
+        "enabled": True,
+        "exporter": "jaeger",
+        "endpoint": "jaeger-collector.monitoring.svc.cluster.local:14268",
+        "sample_ratio": 0.1
+    },
+    "health_checks": {
+        "enabled": True,
+        "liveness_probe": {
+            "path": "/healthz",
+            "port": 8080,
+            "initial_delay_seconds": 30,
+            "period_seconds": 10
+        },
+        "readiness_probe": {
+            "path": "/readyz",
+            "port": 8080,
+            "initial_delay_seconds": 5,
+            "period_seconds": 5
+        }
+    }
+}
+
+_NETWORKING_CONFIGURATION_TEMPLATE: Dict[str, Any] = {
+    "service": {
+        "type": "ClusterIP",
+        "ports": [
             {
-                "issuer": "https://auth.vectorweight.com",
-                "audience": "vectorweight-services",
-                "jwks_url": "https://auth.vectorweight.com/.well-known/jwks.json"
+                "name": "grpc",
+                "port": 3593,
+                "targetPort": 3593,
+                "protocol": "TCP"
             },
             {
-                "issuer": "https://keycloak.vectorweight.internal",
-                "audience": "kubernetes-api",
-                "jwks_url": "https://keycloak.vectorweight.internal/auth/realms/vectorweight/protocol/openid_connect/certs"
+                "name": "http",
+                "port": 3592,
+                "targetPort": 3592,
+                "protocol": "TCP"
+            },
+            {
+                "name": "metrics",
+                "port": 8080,
+                "targetPort": 8080,
+                "protocol": "TCP"
+            }
+        ],
+        "annotations": {
+            "service.beta.kubernetes.io/aws-load-balancer-internal": "true"
+        }
+    },
+    "ingress": {
+        "enabled": False,  # Internal service, no external access
+        "className": "istio",
+        "annotations": {
+            "cert-manager.io/cluster-issuer": "letsencrypt-prod"
+        }
+    },
+    "virtual_service": {
+        "enabled": True,
+        "hosts": [],  # patched per cluster domain
+        "gateways": ["istio-system/default-gateway"],
+        "http": [
+            {
+                "match": [{"uri": {"prefix": "/api/cerbos"}}],
+                "route": [
+                    {
+                        "destination": {
+                            "host": "cerbos.authorization.svc.cluster.local",
+                            "port": {"number": 3592}
+                        }
+                    }
+                ]
             }
         ]
-    
+    }
+}
+
+
+def _cluster_config_key(cluster_config: ClusterConfiguration) -> tuple:
+    """Stable cache key over the cluster attributes this module reads
+
+    Computed once per pipeline stage and shared by the configuration
+    and validation caches, instead of each call-site destructuring the
+    attribute chain on its own.
+    """
+    return (cluster_config.size, cluster_config.name,
+            cluster_config.domain, cluster_config.cerbos_enabled)
+
+
+# Validation as a data-driven rule table: each entry pairs a predicate
+# over (cluster_config, manager) with the warning it produces. The old
+# policy-repository check read policy_repository off PolicyDefinition,
+# which has no such field, so the rule never fired; it now inspects the
+# size's base configuration where the repository URL actually lives.
+_VALIDATION_RULES = (
+    (lambda config, manager: config.size == ClusterSize.MINIMAL,
+     "Minimal cluster size may impact Cerbos performance in production workloads"),
+    (lambda config, manager: not manager.jwt_issuers,
+     "No JWT issuers configured; external authentication integration will be limited"),
+    (lambda config, manager:
+        "github.com" in _base_configuration_for(config.size).policy_repository,
+     "Ensure policy repository is accessible from cluster network"),
+    (lambda config, manager:
+        _resource_requirements_for(config.size)["limits"]["memory"] in ("256Mi", "512Mi"),
+     "Consider increasing memory allocation for production Cerbos deployments"),
+)
+
+
+class CerbosIntegrationManager:
+    """Central manager for Cerbos authorization engine integration"""
+
+    __slots__ = ("default_policies", "jwt_issuers", "_config_cache",
+                 "_validation_cache")
+
+    def __init__(self):
+        self.default_policies = _DEFAULT_POLICIES
+        self.jwt_issuers = _JWT_ISSUERS
+        # Generated configurations keyed by the cluster attributes the
+        # output actually depends on; a pristine copy is cached so later
+        # caller mutations cannot leak into subsequent hits
+        self._config_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._validation_cache: Dict[tuple, tuple] = {}
+
     def generate_configuration(self, cluster_config: ClusterConfiguration) -> Dict[str, Any]:
         """
         Generate comprehensive Cerbos configuration for cluster deployment
@@ -112,9 +513,60 @@ class CerbosIntegrationManager:
         Returns:
             Complete Cerbos deployment configuration dictionary
         """
-        base_config = self._get_base_configuration(cluster_config.size)
-        
-        configuration = {
+        cache_key = _cluster_config_key(cluster_config)
+        cached = self._config_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        configuration = self._build_size_base(cluster_config.size)
+        configuration["monitoring"] = self._generate_monitoring_configuration(cluster_config)
+        configuration["networking"] = self._generate_networking_configuration(cluster_config)
+
+        logger.info("Generated Cerbos configuration for cluster: %s", cluster_config.name)
+
+        self._config_cache[cache_key] = copy.deepcopy(configuration)
+
+        return configuration
+
+    def generate_configurations_bulk(
+        self, cluster_configs: List[ClusterConfiguration]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate Cerbos configurations for many clusters at once
+
+        The heavy sub-generators depend only on cluster size, so the
+        size base is built once per distinct size and each cluster gets
+        a deep copy patched with its monitoring and networking sections
+        — O(sizes) heavy work instead of O(clusters).
+
+        Args:
+            cluster_configs: Cluster configuration specifications
+
+        Returns:
+            Mapping of cluster name to its deployment configuration
+        """
+        size_bases: Dict[ClusterSize, Dict[str, Any]] = {}
+        configurations: Dict[str, Dict[str, Any]] = {}
+
+        for cluster_config in cluster_configs:
+            base = size_bases.get(cluster_config.size)
+            if base is None:
+                base = size_bases[cluster_config.size] = self._build_size_base(cluster_config.size)
+
+            configuration = copy.deepcopy(base)
+            configuration["monitoring"] = self._generate_monitoring_configuration(cluster_config)
+            configuration["networking"] = self._generate_networking_configuration(cluster_config)
+            configurations[cluster_config.name] = configuration
+
+        logger.info("Generated Cerbos configurations for %d clusters", len(configurations))
+
+        return configurations
+
+    def _build_size_base(self, cluster_size: ClusterSize) -> Dict[str, Any]:
+        """Build the size-dependent part of a deployment configuration"""
+        base_config = self._get_base_configuration(cluster_size)
+
+        return {
             "enabled": True,
             "replicas": base_config.replicas,
             "namespace": base_config.namespace,
@@ -123,94 +575,22 @@ class CerbosIntegrationManager:
                 "tag": "0.30.0",
                 "pullPolicy": "IfNotPresent"
             },
-            "resources": self._get_resource_requirements(cluster_config.size),
+            "resources": self._get_resource_requirements(cluster_size),
             "storage": self._generate_storage_configuration(base_config),
             "audit": self._generate_audit_configuration(base_config),
             "postgres": self._generate_postgres_configuration(base_config),
             "policy": self._generate_policy_configuration(base_config),
             "jwt": self._generate_jwt_configuration(),
-            "monitoring": self._generate_monitoring_configuration(cluster_config),
-            "security": self._generate_security_configuration(),
-            "networking": self._generate_networking_configuration(cluster_config)
+            "security": self._generate_security_configuration()
         }
-        
-        logger.info(f"Generated Cerbos configuration for cluster: {cluster_config.name}")
-        
-        return configuration
-    
+
     def _get_base_configuration(self, cluster_size: ClusterSize) -> CerbosConfiguration:
         """Generate base configuration parameters based on cluster size"""
-        size_configurations = {
-            ClusterSize.MINIMAL: CerbosConfiguration(
-                replicas=1,
-                namespace="authorization",
-                storage_enabled=True,
-                storage_size="10Gi",
-                audit_enabled=False,
-                postgres_enabled=False,
-                high_availability=False,
-                policy_repository="https://github.com/vectorweight/cerbos-policies",
-                jwt_verification_enabled=True
-            ),
-            ClusterSize.SMALL: CerbosConfiguration(
-                replicas=2,
-                namespace="authorization",
-                storage_enabled=True,
-                storage_size="25Gi",
-                audit_enabled=True,
-                postgres_enabled=True,
-                high_availability=True,
-                policy_repository="https://github.com/vectorweight/cerbos-policies",
-                jwt_verification_enabled=True
-            ),
-            ClusterSize.MEDIUM: CerbosConfiguration(
-                replicas=3,
-                namespace="authorization",
-                storage_enabled=True,
-                storage_size="50Gi",
-                audit_enabled=True,
-                postgres_enabled=True,
-                high_availability=True,
-                policy_repository="https://github.com/vectorweight/cerbos-policies",
-                jwt_verification_enabled=True
-            ),
-            ClusterSize.LARGE: CerbosConfiguration(
-                replicas=5,
-                namespace="authorization",
-                storage_enabled=True,
-                storage_size="100Gi",
-                audit_enabled=True,
-                postgres_enabled=True,
-                high_availability=True,
-                policy_repository="https://github.com/vectorweight/cerbos-policies",
-                jwt_verification_enabled=True
-            )
-        }
-        
-        return size_configurations.get(cluster_size, size_configurations[ClusterSize.SMALL])
-    
+        return _base_configuration_for(cluster_size)
+
     def _get_resource_requirements(self, cluster_size: ClusterSize) -> Dict[str, Any]:
         """Calculate resource requirements based on cluster size"""
-        resource_mappings = {
-            ClusterSize.MINIMAL: {
-                "requests": {"memory": "256Mi", "cpu": "100m"},
-                "limits": {"memory": "512Mi", "cpu": "250m"}
-            },
-            ClusterSize.SMALL: {
-                "requests": {"memory": "512Mi", "cpu": "250m"},
-                "limits": {"memory": "1Gi", "cpu": "500m"}
-            },
-            ClusterSize.MEDIUM: {
-                "requests": {"memory": "1Gi", "cpu": "500m"},
-                "limits": {"memory": "2Gi", "cpu": "1"}
-            },
-            ClusterSize.LARGE: {
-                "requests": {"memory": "2Gi", "cpu": "1"},
-                "limits": {"memory": "4Gi", "cpu": "2"}
-            }
-        }
-        
-        return resource_mappings.get(cluster_size, resource_mappings[ClusterSize.SMALL])
+        return _resource_requirements_for(cluster_size)
     
     def _generate_storage_configuration(self, config: CerbosConfiguration) -> Dict[str, Any]:
         """Generate storage configuration for Cerbos deployment"""
@@ -295,56 +675,18 @@ class CerbosIntegrationManager:
             "default_policies": self._generate_default_policy_files()
         }
     
-    def _generate_default_policy_files(self) -> Dict[str, str]:
+    def _generate_default_policy_files(
+        self, output_format: Literal["yaml", "json"] = "yaml"
+    ) -> Dict[str, str]:
         """Generate default policy files for VectorWeight deployment"""
-        policy_files = {}
-        
-        for policy in self.default_policies:
-            policy_content = {
-                "apiVersion": "api.cerbos.dev/v1",
-                "resourcePolicy": {
-                    "version": "default",
-                    "resource": policy.resource_type,
-                    "rules": []
-                }
-            }
-            
-            # Generate rules for each action
-            for action in policy.actions:
-                rule = {
-                    "actions": [action],
-                    "effect": "EFFECT_ALLOW",
-                    "roles": policy.roles,
-                    "condition": {
-                        "match": {
-                            "all": {
-                                "of": [
-                                    {"expr": condition} for condition in policy.conditions
-                                ]
-                            }
-                        }
-                    }
-                }
-                
-                if policy.derived_roles:
-                    rule["derivedRoles"] = policy.derived_roles
-                
-                policy_content["resourcePolicy"]["rules"].append(rule)
-            
-            # Convert to YAML string representation
-            import yaml
-            policy_files[f"{policy.resource_type}_policy.yaml"] = yaml.dump(
-                policy_content, default_flow_style=False
-            )
-        
-        return policy_files
+        return _default_policy_files(output_format)
     
     def _generate_jwt_configuration(self) -> Dict[str, Any]:
         """Generate JWT verification configuration"""
         return {
             "verification": {
                 "enabled": True,
-                "issuers": self.jwt_issuers,
+                "issuers": list(self.jwt_issuers),
                 "cache": {
                     "enabled": True,
                     "ttl": "1h",
@@ -365,154 +707,20 @@ class CerbosIntegrationManager:
     
     def _generate_monitoring_configuration(self, cluster_config: ClusterConfiguration) -> Dict[str, Any]:
         """Generate monitoring and observability configuration"""
-        return {
-            "metrics": {
-                "enabled": True,
-                "port": 8080,
-                "path": "/metrics",
-                "service_monitor": {
-                    "enabled": True,
-                    "namespace": "monitoring",
-                    "labels": {
-                        "app.kubernetes.io/name": "cerbos",
-                        "app.kubernetes.io/instance": f"cerbos-{cluster_config.name}"
-                    }
-                }
-            },
-            "tracing": {
-                "enabled": True,
-                "exporter": "jaeger",
-                "endpoint": "jaeger-collector.monitoring.svc.cluster.local:14268",
-                "sample_ratio": 0.1
-            },
-            "health_checks": {
-                "enabled": True,
-                "liveness_probe": {
-                    "path": "/healthz",
-                    "port": 8080,
-                    "initial_delay_seconds": 30,
-                    "period_seconds": 10
-                },
-                "readiness_probe": {
-                    "path": "/readyz",
-                    "port": 8080,
-                    "initial_delay_seconds": 5,
-                    "period_seconds": 5
-                }
-            }
-        }
-    
+        configuration = copy.deepcopy(_MONITORING_CONFIGURATION_TEMPLATE)
+        labels = configuration["metrics"]["service_monitor"]["labels"]
+        labels["app.kubernetes.io/instance"] = f"cerbos-{cluster_config.name}"
+        return configuration
+
     def _generate_security_configuration(self) -> Dict[str, Any]:
         """Generate security configuration for Cerbos deployment"""
-        return {
-            "pod_security_context": {
-                "run_as_non_root": True,
-                "run_as_user": 65534,
-                "run_as_group": 65534,
-                "fs_group": 65534,
-                "seccomp_profile": {
-                    "type": "RuntimeDefault"
-                }
-            },
-            "container_security_context": {
-                "allow_privilege_escalation": False,
-                "read_only_root_filesystem": True,
-                "capabilities": {
-                    "drop": ["ALL"]
-                }
-            },
-            "network_policy": {
-                "enabled": True,
-                "ingress": [
-                    {
-                        "from": [
-                            {"namespaceSelector": {"matchLabels": {"name": "vector-stores"}}},
-                            {"namespaceSelector": {"matchLabels": {"name": "ai-workloads"}}},
-                            {"namespaceSelector": {"matchLabels": {"name": "applications"}}},
-                            {"namespaceSelector": {"matchLabels": {"name": "istio-system"}}}
-                        ],
-                        "ports": [
-                            {"protocol": "TCP", "port": 3593},  # Cerbos gRPC
-                            {"protocol": "TCP", "port": 3592}   # Cerbos HTTP
-                        ]
-                    }
-                ],
-                "egress": [
-                    {
-                        "to": [
-                            {"namespaceSelector": {"matchLabels": {"name": "authorization"}}}
-                        ],
-                        "ports": [
-                            {"protocol": "TCP", "port": 5432}  # PostgreSQL
-                        ]
-                    },
-                    {
-                        "to": [],
-                        "ports": [
-                            {"protocol": "TCP", "port": 443},  # HTTPS for JWT verification
-                            {"protocol": "TCP", "port": 53},   # DNS
-                            {"protocol": "UDP", "port": 53}    # DNS
-                        ]
-                    }
-                ]
-            }
-        }
-    
+        return copy.deepcopy(_SECURITY_CONFIGURATION)
+
     def _generate_networking_configuration(self, cluster_config: ClusterConfiguration) -> Dict[str, Any]:
         """Generate networking configuration for Cerbos service exposure"""
-        return {
-            "service": {
-                "type": "ClusterIP",
-                "ports": [
-                    {
-                        "name": "grpc",
-                        "port": 3593,
-                        "targetPort": 3593,
-                        "protocol": "TCP"
-                    },
-                    {
-                        "name": "http",
-                        "port": 3592,
-                        "targetPort": 3592,
-                        "protocol": "TCP"
-                    },
-                    {
-                        "name": "metrics",
-                        "port": 8080,
-                        "targetPort": 8080,
-                        "protocol": "TCP"
-                    }
-                ],
-                "annotations": {
-                    "service.beta.kubernetes.io/aws-load-balancer-internal": "true"
-                }
-            },
-            "ingress": {
-                "enabled": False,  # Internal service, no external access
-                "className": "istio",
-                "annotations": {
-                    "cert-manager.io/cluster-issuer": "letsencrypt-prod"
-                }
-            },
-            "virtual_service": {
-                "enabled": True,
-                "hosts": [f"cerbos.{cluster_config.domain}"],
-                "gateways": ["istio-system/default-gateway"],
-                "http": [
-                    {
-                        "match": [{"uri": {"prefix": "/api/cerbos"}}],
-                        "route": [
-                            {
-                                "destination": {
-                                    "host": "cerbos.authorization.svc.cluster.local",
-                                    "port": {"number": 3592}
-                                }
-                            }
-                        ]
-                    }
-                ]
-            }
-        }
+        configuration = copy.deepcopy(_NETWORKING_CONFIGURATION_TEMPLATE)
+        configuration["virtual_service"]["hosts"] = [f"cerbos.{cluster_config.domain}"]
+        return configuration
     
     @staticmethod
     def generate_chart_reference() -> Dict[str, str]:
@@ -526,45 +734,53 @@ class CerbosIntegrationManager:
     def validate_configuration(self, cluster_config: ClusterConfiguration) -> List[str]:
         """
         Validate Cerbos configuration and return warnings or recommendations
-        
+
         Args:
             cluster_config: Cluster configuration to validate
-            
+
         Returns:
             List of validation warnings or recommendations
         """
-        warnings = []
-        
         if not cluster_config.cerbos_enabled:
-            warnings.append("Cerbos authorization is disabled; consider enabling for enhanced security")
-            return warnings
-        
-        # Check cluster size recommendations
-        if cluster_config.size == ClusterSize.MINIMAL:
-            warnings.append("Minimal cluster size may impact Cerbos performance in production workloads")
-        
-        # Check JWT configuration requirements
-        if not self.jwt_issuers:
-            warnings.append("No JWT issuers configured; external authentication integration will be limited")
-        
-        # Check policy repository accessibility
-        if "github.com" in self.default_policies[0].__dict__.get("policy_repository", ""):
-            warnings.append("Ensure policy repository is accessible from cluster network")
-        
-        # Check resource allocation
-        resource_reqs = self._get_resource_requirements(cluster_config.size)
-        memory_limit = resource_reqs["limits"]["memory"]
-        if memory_limit in ["256Mi", "512Mi"]:
-            warnings.append("Consider increasing memory allocation for production Cerbos deployments")
-        
-        return warnings
+            return ["Cerbos authorization is disabled; consider enabling for enhanced security"]
+
+        cache_key = _cluster_config_key(cluster_config)
+        cached = self._validation_cache.get(cache_key)
+        if cached is None:
+            cached = self._validation_cache[cache_key] = tuple(
+                warning for predicate, warning in _VALIDATION_RULES
+                if predicate(cluster_config, self)
+            )
+        return list(cached)
     
-    def generate_policy_examples(self) -> Dict[str, str]:
+    def generate_policy_examples(
+        self, output_format: Literal["yaml", "json"] = "yaml"
+    ) -> Dict[str, str]:
         """Generate example policy files for documentation purposes"""
-        examples = {}
-        
-        # Vector store access policy example
-        vector_policy = """
+        if output_format == "json":
+            return _policy_examples_json()
+        return _POLICY_EXAMPLES
+
+
+@functools.lru_cache(maxsize=1)
+def _policy_examples_json() -> Dict[str, str]:
+    """JSON renditions of the example policies, converted once on demand
+
+    The examples are authored as YAML documentation text, so the JSON
+    variant parses them a single time; the import stays local because
+    nothing else in this module needs yaml anymore.
+    """
+    import yaml
+
+    return {
+        name.replace(".yaml", ".json"): _dump_json(yaml.safe_load(text))
+        for name, text in _POLICY_EXAMPLES.items()
+    }
+
+
+# Example policies are static documentation text; held once at module
+# level behind a read-only mapping instead of being rebuilt per call
+_VECTOR_POLICY_EXAMPLE = """
 apiVersion: api.cerbos.dev/v1
 resourcePolicy:
   version: "default"
@@ -590,11 +806,8 @@ resourcePolicy:
               - expr: "request.user.role in ['ai-engineer', 'data-engineer']"
               - expr: "request.resource.owner == request.user.id || request.user.permissions contains 'admin'"
 """
-        
-        examples["vector_store_policy_example.yaml"] = vector_policy
-        
-        # AI model deployment policy example
-        model_policy = """
+
+_MODEL_POLICY_EXAMPLE = """
 apiVersion: api.cerbos.dev/v1
 resourcePolicy:
   version: "default"
@@ -621,7 +834,8 @@ resourcePolicy:
               - expr: "request.resource.status == 'production'"
               - expr: "request.user.project_access contains request.resource.project"
 """
-        
-        examples["ai_model_policy_example.yaml"] = model_policy
-        
-        return examples
+
+_POLICY_EXAMPLES: Dict[str, str] = types.MappingProxyType({
+    "vector_store_policy_example.yaml": _VECTOR_POLICY_EXAMPLE,
+    "ai_model_policy_example.yaml": _MODEL_POLICY_EXAMPLE,
+})
@@ -4,19 +4,101 @@ GitHub API Integration Module
 Professional GitHub repository management using PyGithub
 """
 
+import base64
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set
 from dataclasses import dataclass
-from github import Github, GithubException, Repository
+import urllib3
+from github import Github, GithubException, InputGitTreeElement, Repository
 from github.ContentFile import ContentFile
 
 logger = logging.getLogger(__name__)
 
+# Conditional-request caching: GitHub tags idempotent GETs with ETags
+# and 304 replays are free against the primary rate limit, so when
+# requests_cache is installed the HTTP layer revalidates instead of
+# re-downloading. Persisted next to the validation cache.
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
-@dataclass
+# HTTP/2 multiplexed transport: niquests is a drop-in requests
+# replacement that negotiates h2, so all concurrent GitHub calls share
+# one TLS connection instead of paying a handshake per pooled socket.
+try:
+    import niquests
+except ImportError:
+    niquests = None
+
+_HTTP_CACHE_PATH = Path.home() / ".cache" / "vectorweight" / "github_cache"
+
+
+def _install_http2_transport() -> bool:
+    """Point PyGithub's transport at niquests when it is installed
+
+    Returns True when the swap happened. Mutually exclusive with the
+    requests_cache patch below: multiplexing helps every call while the
+    ETag cache only helps revalidated GETs, so HTTP/2 wins when both
+    libraries are present.
+    """
+    if niquests is None:
+        return False
+    import github.Requester as _requester_module
+    _requester_module.requests = niquests
+    logger.debug("GitHub transport switched to niquests (HTTP/2)")
+    return True
+
+
+def _install_http_cache() -> None:
+    if requests_cache is None or requests_cache.patcher.is_installed():
+        return
+    try:
+        _HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        requests_cache.install_cache(
+            str(_HTTP_CACHE_PATH), backend="sqlite", cache_control=True)
+    except OSError:
+        logger.debug("Could not set up GitHub HTTP cache", exc_info=True)
+
+
+# Upper bound on concurrent GitHub API calls during bulk operations;
+# keeps fan-out well under GitHub's secondary-rate-limit radar
+_MAX_CONCURRENT_REQUESTS = 10
+
+# Transient failures (secondary rate limits, gateway errors) would
+# otherwise abort a bulk operation mid-batch; exponential backoff that
+# honours Retry-After keeps it moving without hammering the API
+_API_RETRY = urllib3.Retry(
+    total=5,
+    backoff_factor=2,
+    status_forcelist=[403, 429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+)
+
+
+def _git_blob_sha(data: bytes) -> str:
+    """Git's blob object id: sha1 over 'blob <len>\\0' + content
+
+    Computing it locally lets bulk updates detect byte-identical files
+    without any network traffic.
+    """
+    digest = hashlib.sha1(f"blob {len(data)}\0".encode())
+    digest.update(data)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
 class RepositoryTemplate:
-    """Template configuration for repository creation"""
+    """Template configuration for repository creation
+
+    Frozen and slotted: templates are shared read-only descriptions, and
+    dropping the per-instance __dict__ keeps them cheap when one is
+    built per cluster.
+    """
     name: str
     description: str
     private: bool = False
@@ -39,11 +121,23 @@ class GitHubRepositoryManager:
             token: GitHub personal access token with repo permissions
             organization: Target GitHub organization name
         """
-        self.github = Github(token)
+        if not _install_http2_transport():
+            _install_http_cache()
+
+        # per_page=100 (the API maximum) cuts paginated listings to a
+        # third of the default-30 round trips
+        self.github = Github(token, per_page=100, retry=_API_RETRY)
         self.organization_name = organization
         self._organization = None
         self._user = None
-        
+
+        # Repository objects fetched once per name; every public method
+        # resolves through _get_repository, so without this each call
+        # pays a redundant GET for an object already in hand. Guarded by
+        # a lock because provisioning fans out across threads.
+        self._repo_cache: Dict[str, Repository] = {}
+        self._repo_cache_lock = threading.Lock()
+
         # Validate authentication and permissions
         self._validate_authentication()
     
@@ -68,6 +162,10 @@ class GitHubRepositoryManager:
         except GithubException as e:
             logger.error(f"GitHub authentication failed: {e}")
             raise ValueError(f"Invalid GitHub token or insufficient permissions: {e}")
+
+        # The org-vs-user decision never changes after authentication;
+        # binding it once removes the repeated branch from every lookup
+        self._repo_source = self._organization or self._user
     
     def repository_exists(self, repository_name: str) -> bool:
         """
@@ -79,6 +177,11 @@ class GitHubRepositoryManager:
         Returns:
             True if repository exists, False otherwise
         """
+        # A cached Repository object is proof of existence — answer
+        # without touching the network
+        with self._repo_cache_lock:
+            if repository_name in self._repo_cache:
+                return True
         try:
             self._get_repository(repository_name)
             return True
@@ -88,101 +191,194 @@ class GitHubRepositoryManager:
             raise
     
     def _get_repository(self, repository_name: str) -> Repository:
-        """Get repository object from GitHub API"""
-        if self._organization:
-            return self._organization.get_repo(repository_name)
-        else:
-            return self._user.get_repo(repository_name)
+        """Get repository object from GitHub API (cached per name)"""
+        with self._repo_cache_lock:
+            repo = self._repo_cache.get(repository_name)
+        if repo is None:
+            repo = self._repo_source.get_repo(repository_name)
+            with self._repo_cache_lock:
+                repo = self._repo_cache.setdefault(repository_name, repo)
+        return repo
     
-    def create_repository(self, template: RepositoryTemplate) -> Repository:
+    def create_repository(self, template: RepositoryTemplate,
+                          protect_default: bool = False) -> Repository:
         """
         Create new GitHub repository with specified configuration
-        
+
         Args:
             template: Repository configuration template
-            
+            protect_default: Apply branch protection to the default
+                branch using the repository object already in hand,
+                saving the extra lookup of a separate setup call
+
         Returns:
             Created repository object
-            
+
         Raises:
-            ValueError: If repository already exists
             GithubException: If creation fails
         """
-        if self.repository_exists(template.name):
-            logger.warning(f"Repository {template.name} already exists")
-            return self._get_repository(template.name)
-        
+        # One POST on the happy path; an existing repository surfaces as
+        # 422 and falls back to a single GET, instead of paying a probe
+        # GET before every create
         try:
-            if self._organization:
-                repo = self._organization.create_repo(
-                    name=template.name,
-                    description=template.description,
-                    private=template.private,
-                    has_issues=template.has_issues,
-                    has_wiki=template.has_wiki,
-                    has_downloads=template.has_downloads,
-                    gitignore_template=template.gitignore_template,
-                    license_template=template.license_template
-                )
-            else:
-                repo = self._user.create_repo(
-                    name=template.name,
-                    description=template.description,
-                    private=template.private,
-                    has_issues=template.has_issues,
-                    has_wiki=template.has_wiki,
-                    has_downloads=template.has_downloads,
-                    gitignore_template=template.gitignore_template,
-                    license_template=template.license_template
-                )
-            
+            repo = self._repo_source.create_repo(
+                name=template.name,
+                description=template.description,
+                private=template.private,
+                has_issues=template.has_issues,
+                has_wiki=template.has_wiki,
+                has_downloads=template.has_downloads,
+                gitignore_template=template.gitignore_template,
+                license_template=template.license_template
+            )
+
             logger.info(f"Created repository: {repo.full_name}")
-            return repo
-            
+            with self._repo_cache_lock:
+                self._repo_cache[template.name] = repo
+
         except GithubException as e:
-            logger.error(f"Repository creation failed: {e}")
-            raise
+            if e.status == 422:
+                logger.warning(f"Repository {template.name} already exists")
+                repo = self._get_repository(template.name)
+            else:
+                logger.error(f"Repository creation failed: {e}")
+                raise
+
+        if protect_default:
+            self._protect_branch(repo, template.default_branch)
+        return repo
+
+    def _protect_branch(self, repo: Repository, branch_name: str) -> None:
+        """Apply the standard protection rules to a branch of a repo in hand"""
+        try:
+            branch = repo.get_branch(branch_name)
+            branch.edit_protection(
+                strict=True,
+                contexts=[],
+                enforce_admins=False,
+                dismiss_stale_reviews=True,
+                require_code_owner_reviews=False,
+                required_approving_review_count=1
+            )
+            logger.info(f"Branch protection configured for {repo.name}")
+
+        except GithubException as e:
+            logger.warning(f"Branch protection setup failed: {e}")
     
     def update_repository_content(self, repository_name: str, content_map: Dict[str, str]) -> None:
         """
         Update repository content with file mappings
-        
+
+        Thin string-keyed wrapper: each file is encoded to utf-8 exactly
+        once and handed to the bytes-native fast path below.
+
         Args:
             repository_name: Target repository name
             content_map: Dictionary mapping file paths to content
         """
+        self.update_repository_content_bytes(
+            repository_name,
+            {path: content.encode("utf-8") for path, content in content_map.items()})
+
+    def update_repository_content_bytes(self, repository_name: str,
+                                        content_map: Dict[str, bytes]) -> None:
+        """
+        Update repository content from already-encoded bytes
+
+        All files land in a single atomic commit through the Git Data
+        API (blobs -> tree -> commit -> ref), so the API cost is
+        near-constant in file count instead of 1-2 calls per file, and
+        no existence probes are needed — the tree overwrites by path.
+        Taking bytes directly lets callers that already hold encoded
+        payloads (rendered archives, binary assets) skip the str
+        round trip entirely.
+
+        Args:
+            repository_name: Target repository name
+            content_map: Dictionary mapping file paths to file bytes
+        """
+        if not content_map:
+            return
+
         repo = self._get_repository(repository_name)
-        
-        for file_path, content in content_map.items():
+
+        try:
+            branch = repo.default_branch or "main"
             try:
-                # Check if file exists
-                try:
-                    existing_file = repo.get_contents(file_path)
-                    # Update existing file
-                    repo.update_file(
-                        path=file_path,
-                        message=f"Update {file_path}",
-                        content=content,
-                        sha=existing_file.sha
-                    )
-                    logger.debug(f"Updated file: {file_path}")
-                    
-                except GithubException as e:
-                    if e.status == 404:
-                        # Create new file
-                        repo.create_file(
-                            path=file_path,
-                            message=f"Add {file_path}",
-                            content=content
-                        )
-                        logger.debug(f"Created file: {file_path}")
-                    else:
-                        raise
-                        
+                head_ref = repo.get_git_ref(f"heads/{branch}")
             except GithubException as e:
-                logger.error(f"Failed to update {file_path}: {e}")
-                raise
-    
+                # A just-created repository (provisioned without
+                # auto_init) has no refs yet — the Git Data API cannot
+                # commit onto nothing, so the first commit goes through
+                # the contents API, which seeds empty repos
+                if e.status not in (404, 409):
+                    raise
+                self._populate_empty_repository(repo, content_map)
+                return
+            head_sha = head_ref.object.sha
+
+            # One recursive tree listing yields every blob SHA on the
+            # branch; comparing against locally computed blob ids drops
+            # byte-identical files before any write. On a truncated
+            # listing (very large repos) everything is pushed as before.
+            base_tree = repo.get_git_tree(head_sha, recursive=True)
+            existing = {}
+            if not base_tree.truncated:
+                existing = {e.path: e.sha for e in base_tree.tree if e.type == "blob"}
+
+            pending = {
+                file_path: data
+                for file_path, data in content_map.items()
+                if existing.get(file_path) != _git_blob_sha(data)
+            }
+            if not pending:
+                logger.debug(f"No content changes for {repository_name}@{branch}")
+                return
+
+            # Blob creation is the only per-file round trip left; those
+            # POSTs are independent, so fan them out over a bounded pool.
+            # Blobs go up base64-encoded: the payload is binary-safe and
+            # skips the per-character JSON string escaping of raw utf-8.
+            def create_blob(item):
+                file_path, data = item
+                blob = repo.create_git_blob(
+                    base64.b64encode(data).decode("ascii"), "base64")
+                return InputGitTreeElement(
+                    path=file_path, mode="100644", type="blob", sha=blob.sha)
+
+            if len(pending) > 1:
+                workers = min(_MAX_CONCURRENT_REQUESTS, len(pending))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    elements = list(executor.map(create_blob, pending.items()))
+            else:
+                elements = [create_blob(item) for item in pending.items()]
+
+            tree = repo.create_git_tree(elements, base_tree=base_tree)
+            parent = repo.get_git_commit(head_sha)
+            commit = repo.create_git_commit(
+                f"Update {len(elements)} generated files", tree, [parent])
+            head_ref.edit(commit.sha)
+
+            logger.debug(f"Committed {len(elements)} files to {repository_name}@{branch}")
+
+        except GithubException as e:
+            logger.error(f"Bulk content update failed for {repository_name}: {e}")
+            raise
+
+    def _populate_empty_repository(self, repo: Repository,
+                                   content_map: Dict[str, bytes]) -> None:
+        """Seed an empty repository through the contents API
+
+        Each create_file call is a commit of its own, so this costs one
+        round trip per file — acceptable for the one-time first
+        population; every later update takes the bulk Git Data path.
+        The first call establishes the default branch.
+        """
+        for file_path, data in content_map.items():
+            repo.create_file(file_path, f"Add {file_path}", data)
+        logger.debug(f"Seeded empty repository {repo.name} "
+                     f"with {len(content_map)} files")
+
     def setup_branch_protection(self, repository_name: str) -> None:
         """
         Configure branch protection rules for main branch
@@ -190,22 +386,7 @@ class GitHubRepositoryManager:
         Args:
             repository_name: Target repository name
         """
-        repo = self._get_repository(repository_name)
-        
-        try:
-            main_branch = repo.get_branch("main")
-            main_branch.edit_protection(
-                strict=True,
-                contexts=[],
-                enforce_admins=False,
-                dismiss_stale_reviews=True,
-                require_code_owner_reviews=False,
-                required_approving_review_count=1
-            )
-            logger.info(f"Branch protection configured for {repository_name}")
-            
-        except GithubException as e:
-            logger.warning(f"Branch protection setup failed: {e}")
+        self._protect_branch(self._get_repository(repository_name), "main")
     
     def create_deployment_key(self, repository_name: str, key_title: str, 
                            public_key: str, read_only: bool = True) -> None:
@@ -232,23 +413,53 @@ class GitHubRepositoryManager:
             logger.error(f"Failed to add deployment key: {e}")
             raise
     
-    def list_repositories(self) -> List[str]:
+    def bulk_default_branches(self, repository_names: List[str]) -> Dict[str, str]:
         """
-        List all accessible repositories
-        
+        Resolve default branches for many repositories in one API call
+
+        A single GraphQL query with one alias per repository replaces M
+        per-repo REST lookups, so callers syncing a whole fleet pay one
+        round trip regardless of cluster count.
+
+        Args:
+            repository_names: Names of repositories to resolve
+
         Returns:
-            List of repository names
+            Dictionary mapping repository name to its default branch;
+            repositories that do not exist are omitted
         """
-        repositories = []
-        
-        if self._organization:
-            for repo in self._organization.get_repos():
-                repositories.append(repo.name)
-        else:
-            for repo in self._user.get_repos():
-                repositories.append(repo.name)
-        
-        return repositories
+        if not repository_names:
+            return {}
+
+        owner = self._repo_source.login
+        fields = " ".join(
+            f'r{index}: repository(owner: $owner, name: "{name}") '
+            "{ name defaultBranchRef { name } }"
+            for index, name in enumerate(repository_names)
+        )
+        query = f"query($owner: String!) {{ {fields} }}"
+        _, data = self.github.requester.requestJsonAndCheck(
+            "POST", "/graphql",
+            input={"query": query, "variables": {"owner": owner}})
+
+        branches = {}
+        for entry in (data.get("data") or {}).values():
+            if entry and entry.get("defaultBranchRef"):
+                branches[entry["name"]] = entry["defaultBranchRef"]["name"]
+        return branches
+
+    def list_repositories(self) -> Iterator[str]:
+        """
+        List all accessible repositories
+
+        Yields lazily so callers that stop early (membership tests,
+        prefix scans) never force PyGithub to fetch the remaining pages.
+
+        Yields:
+            Repository names
+        """
+        for repo in self._repo_source.get_repos():
+            yield repo.name
     
     def delete_repository(self, repository_name: str) -> None:
         """
@@ -261,54 +472,55 @@ class GitHubRepositoryManager:
         
         try:
             repo.delete()
+            with self._repo_cache_lock:
+                self._repo_cache.pop(repository_name, None)
             logger.warning(f"Deleted repository: {repository_name}")
-            
+
         except GithubException as e:
             logger.error(f"Repository deletion failed: {e}")
             raise
 
 
+# Repository templates are immutable, so one set built at import time
+# is shared by every orchestrator instance
+_CLUSTER_TEMPLATES: Dict[str, RepositoryTemplate] = {
+    "dev-cluster": RepositoryTemplate(
+        name="dev-cluster",
+        description="VectorWeight development cluster configuration",
+        private=False
+    ),
+    "ai-cluster": RepositoryTemplate(
+        name="ai-cluster",
+        description="VectorWeight AI/ML cluster configuration",
+        private=False
+    ),
+    "homelab-cluster": RepositoryTemplate(
+        name="homelab-cluster",
+        description="VectorWeight homelab cluster configuration",
+        private=False
+    ),
+    "security-cluster": RepositoryTemplate(
+        name="security-cluster",
+        description="VectorWeight security and monitoring cluster configuration",
+        private=False
+    )
+}
+
+_ORCHESTRATION_TEMPLATE = RepositoryTemplate(
+    name="orchestration-repo",
+    description="VectorWeight central GitOps orchestration repository",
+    private=False
+)
+
+
 class VectorWeightRepositoryOrchestrator:
     """High-level orchestrator for VectorWeight repository management"""
-    
+
     def __init__(self, github_manager: GitHubRepositoryManager):
         self.github = github_manager
-        self.cluster_templates = self._initialize_cluster_templates()
-        self.orchestration_template = self._initialize_orchestration_template()
-    
-    def _initialize_cluster_templates(self) -> Dict[str, RepositoryTemplate]:
-        """Initialize repository templates for cluster configurations"""
-        return {
-            "dev-cluster": RepositoryTemplate(
-                name="dev-cluster",
-                description="VectorWeight development cluster configuration",
-                private=False
-            ),
-            "ai-cluster": RepositoryTemplate(
-                name="ai-cluster", 
-                description="VectorWeight AI/ML cluster configuration",
-                private=False
-            ),
-            "homelab-cluster": RepositoryTemplate(
-                name="homelab-cluster",
-                description="VectorWeight homelab cluster configuration", 
-                private=False
-            ),
-            "security-cluster": RepositoryTemplate(
-                name="security-cluster",
-                description="VectorWeight security and monitoring cluster configuration",
-                private=False
-            )
-        }
-    
-    def _initialize_orchestration_template(self) -> RepositoryTemplate:
-        """Initialize orchestration repository template"""
-        return RepositoryTemplate(
-            name="orchestration-repo",
-            description="VectorWeight central GitOps orchestration repository",
-            private=False
-        )
-    
+        self.cluster_templates = _CLUSTER_TEMPLATES
+        self.orchestration_template = _ORCHESTRATION_TEMPLATE
+
     def ensure_repositories_exist(self, cluster_names: List[str]) -> Dict[str, Repository]:
         """
         Ensure all required repositories exist, creating if necessary
@@ -319,9 +531,10 @@ class VectorWeightRepositoryOrchestrator:
         Returns:
             Dictionary mapping cluster names to repository objects
         """
-        repositories = {}
-        
-        # Create cluster repositories
+        # Clusters are independent of each other and each provision
+        # costs several HTTP round trips, so fan them (plus the
+        # orchestration repo) out over a bounded pool
+        tasks = []
         for cluster_name in cluster_names:
             template = self.cluster_templates.get(cluster_name)
             if not template:
@@ -330,19 +543,19 @@ class VectorWeightRepositoryOrchestrator:
                     description=f"VectorWeight {cluster_name} cluster configuration",
                     private=False
                 )
-            
-            repo = self.github.create_repository(template)
-            repositories[cluster_name] = repo
-            
-            # Configure branch protection
-            self.github.setup_branch_protection(cluster_name)
-        
-        # Create orchestration repository
-        orchestration_repo = self.github.create_repository(self.orchestration_template)
-        repositories["orchestration"] = orchestration_repo
-        self.github.setup_branch_protection("orchestration-repo")
-        
-        return repositories
+            tasks.append((cluster_name, template))
+        tasks.append(("orchestration", self.orchestration_template))
+
+        def provision(task):
+            key, template = task
+            repo = self.github.create_repository(template, protect_default=True)
+            return key, repo
+
+        if len(tasks) > 1:
+            workers = min(8, len(tasks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return dict(executor.map(provision, tasks))
+        return dict(provision(task) for task in tasks)
     
     def populate_repository_content(self, repository_name: str, 
                                   content_generator) -> None:
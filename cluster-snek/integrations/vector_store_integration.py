@@ -4,8 +4,10 @@ Vector Store Integration Module
 Comprehensive vector database management for AI/ML workloads
 """
 
+import copy
 import logging
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import ClassVar, Dict, List, Mapping, Optional, Any
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
@@ -14,9 +16,24 @@ from vectorweight.config.schema import ClusterConfiguration, VectorStoreType, Cl
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _cluster_config_key(cluster_config: ClusterConfiguration) -> tuple:
+    """Hashable key over the cluster fields the generated config depends on"""
+    return (
+        cluster_config.vector_store,
+        cluster_config.size,
+        cluster_config.name,
+        cluster_config.domain,
+        cluster_config.gpu_enabled,
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class VectorStoreConfiguration:
-    """Vector store deployment configuration"""
+    """Vector store deployment configuration
+
+    Frozen and slotted so the per-size defaults below can be shared
+    read-only between calls instead of rebuilt per invocation.
+    """
     provider: str
     namespace: str
     storage_size: str
@@ -50,7 +67,60 @@ class VectorStoreProvider(ABC):
 
 class WeaviateProvider(VectorStoreProvider):
     """Weaviate vector database provider implementation"""
-    
+
+    # Per-size defaults built once at import; instances are frozen so
+    # sharing them across calls is safe
+    _SIZE_CONFIGS: ClassVar[Mapping[ClusterSize, VectorStoreConfiguration]] = MappingProxyType({
+        ClusterSize.MINIMAL: VectorStoreConfiguration(
+            provider="weaviate",
+            namespace="vector-stores",
+            storage_size="50Gi",
+            memory_allocation="4Gi",
+            cpu_allocation="1",
+            replicas=1,
+            authentication_enabled=True,
+            encryption_enabled=True,
+            monitoring_enabled=False,
+            backup_enabled=False
+        ),
+        ClusterSize.SMALL: VectorStoreConfiguration(
+            provider="weaviate",
+            namespace="vector-stores",
+            storage_size="100Gi",
+            memory_allocation="8Gi",
+            cpu_allocation="2",
+            replicas=2,
+            authentication_enabled=True,
+            encryption_enabled=True,
+            monitoring_enabled=True,
+            backup_enabled=True
+        ),
+        ClusterSize.MEDIUM: VectorStoreConfiguration(
+            provider="weaviate",
+            namespace="vector-stores",
+            storage_size="250Gi",
+            memory_allocation="16Gi",
+            cpu_allocation="4",
+            replicas=3,
+            authentication_enabled=True,
+            encryption_enabled=True,
+            monitoring_enabled=True,
+            backup_enabled=True
+        ),
+        ClusterSize.LARGE: VectorStoreConfiguration(
+            provider="weaviate",
+            namespace="vector-stores",
+            storage_size="500Gi",
+            memory_allocation="32Gi",
+            cpu_allocation="8",
+            replicas=5,
+            authentication_enabled=True,
+            encryption_enabled=True,
+            monitoring_enabled=True,
+            backup_enabled=True
+        )
+    })
+
     def generate_helm_values(self, cluster_config: ClusterConfiguration) -> Dict[str, Any]:
         """Generate Weaviate-specific Helm values"""
         base_config = self.get_default_configuration(cluster_config.size)
@@ -126,63 +196,63 @@ class WeaviateProvider(VectorStoreProvider):
     
     def get_default_configuration(self, cluster_size: ClusterSize) -> VectorStoreConfiguration:
         """Get Weaviate default configuration based on cluster size"""
-        size_configurations = {
-            ClusterSize.MINIMAL: VectorStoreConfiguration(
-                provider="weaviate",
-                namespace="vector-stores",
-                storage_size="50Gi",
-                memory_allocation="4Gi",
-                cpu_allocation="1",
-                replicas=1,
-                authentication_enabled=True,
-                encryption_enabled=True,
-                monitoring_enabled=False,
-                backup_enabled=False
-            ),
-            ClusterSize.SMALL: VectorStoreConfiguration(
-                provider="weaviate",
-                namespace="vector-stores",
-                storage_size="100Gi",
-                memory_allocation="8Gi",
-                cpu_allocation="2",
-                replicas=2,
-                authentication_enabled=True,
-                encryption_enabled=True,
-                monitoring_enabled=True,
-                backup_enabled=True
-            ),
-            ClusterSize.MEDIUM: VectorStoreConfiguration(
-                provider="weaviate",
-                namespace="vector-stores",
-                storage_size="250Gi",
-                memory_allocation="16Gi",
-                cpu_allocation="4",
-                replicas=3,
-                authentication_enabled=True,
-                encryption_enabled=True,
-                monitoring_enabled=True,
-                backup_enabled=True
-            ),
-            ClusterSize.LARGE: VectorStoreConfiguration(
-                provider="weaviate",
-                namespace="vector-stores",
-                storage_size="500Gi",
-                memory_allocation="32Gi",
-                cpu_allocation="8",
-                replicas=5,
-                authentication_enabled=True,
-                encryption_enabled=True,
-                monitoring_enabled=True,
-                backup_enabled=True
-            )
-        }
-        
-        return size_configurations.get(cluster_size, size_configurations[ClusterSize.SMALL])
+        return self._SIZE_CONFIGS.get(cluster_size, self._SIZE_CONFIGS[ClusterSize.SMALL])
 
 
 class QdrantProvider(VectorStoreProvider):
     """Qdrant vector database provider implementation"""
-    
+
+    _SIZE_CONFIGS: ClassVar[Mapping[ClusterSize, VectorStoreConfiguration]] = MappingProxyType({
+        ClusterSize.MINIMAL: VectorStoreConfiguration(
+            provider="qdrant",
+            namespace="vector-stores",
+            storage_size="20Gi",
+            memory_allocation="2Gi",
+            cpu_allocation="500m",
+            replicas=1,
+            authentication_enabled=True,
+            encryption_enabled=True,
+            monitoring_enabled=False,
+            backup_enabled=False
+        ),
+        ClusterSize.SMALL: VectorStoreConfiguration(
+            provider="qdrant",
+            namespace="vector-stores",
+            storage_size="50Gi",
+            memory_allocation="4Gi",
+            cpu_allocation="1",
+            replicas=2,
+            authentication_enabled=True,
+            encryption_enabled=True,
+            monitoring_enabled=True,
+            backup_enabled=True
+        ),
+        ClusterSize.MEDIUM: VectorStoreConfiguration(
+            provider="qdrant",
+            namespace="vector-stores",
+            storage_size="100Gi",
+            memory_allocation="8Gi",
+            cpu_allocation="2",
+            replicas=3,
+            authentication_enabled=True,
+            encryption_enabled=True,
+            monitoring_enabled=True,
+            backup_enabled=True
+        ),
+        ClusterSize.LARGE: VectorStoreConfiguration(
+            provider="qdrant",
+            namespace="vector-stores",
+            storage_size="200Gi",
+            memory_allocation="16Gi",
+            cpu_allocation="4",
+            replicas=5,
+            authentication_enabled=True,
+            encryption_enabled=True,
+            monitoring_enabled=True,
+            backup_enabled=True
+        )
+    })
+
     def generate_helm_values(self, cluster_config: ClusterConfiguration) -> Dict[str, Any]:
         """Generate Qdrant-specific Helm values"""
         base_config = self.get_default_configuration(cluster_config.size)
@@ -253,63 +323,63 @@ class QdrantProvider(VectorStoreProvider):
     
     def get_default_configuration(self, cluster_size: ClusterSize) -> VectorStoreConfiguration:
         """Get Qdrant default configuration based on cluster size"""
-        size_configurations = {
-            ClusterSize.MINIMAL: VectorStoreConfiguration(
-                provider="qdrant",
-                namespace="vector-stores",
-                storage_size="20Gi",
-                memory_allocation="2Gi",
-                cpu_allocation="500m",
-                replicas=1,
-                authentication_enabled=True,
-                encryption_enabled=True,
-                monitoring_enabled=False,
-                backup_enabled=False
-            ),
-            ClusterSize.SMALL: VectorStoreConfiguration(
-                provider="qdrant",
-                namespace="vector-stores",
-                storage_size="50Gi",
-                memory_allocation="4Gi",
-                cpu_allocation="1",
-                replicas=2,
-                authentication_enabled=True,
-                encryption_enabled=True,
-                monitoring_enabled=True,
-                backup_enabled=True
-            ),
-            ClusterSize.MEDIUM: VectorStoreConfiguration(
-                provider="qdrant",
-                namespace="vector-stores",
-                storage_size="100Gi",
-                memory_allocation="8Gi",
-                cpu_allocation="2",
-                replicas=3,
-                authentication_enabled=True,
-                encryption_enabled=True,
-                monitoring_enabled=True,
-                backup_enabled=True
-            ),
-            ClusterSize.LARGE: VectorStoreConfiguration(
-                provider="qdrant",
-                namespace="vector-stores",
-                storage_size="200Gi",
-                memory_allocation="16Gi",
-                cpu_allocation="4",
-                replicas=5,
-                authentication_enabled=True,
-                encryption_enabled=True,
-                monitoring_enabled=True,
-                backup_enabled=True
-            )
-        }
-        
-        return size_configurations.get(cluster_size, size_configurations[ClusterSize.SMALL])
+        return self._SIZE_CONFIGS.get(cluster_size, self._SIZE_CONFIGS[ClusterSize.SMALL])
 
 
 class ChromaProvider(VectorStoreProvider):
     """Chroma vector database provider implementation"""
-    
+
+    _SIZE_CONFIGS: ClassVar[Mapping[ClusterSize, VectorStoreConfiguration]] = MappingProxyType({
+        ClusterSize.MINIMAL: VectorStoreConfiguration(
+            provider="chroma",
+            namespace="vector-stores",
+            storage_size="10Gi",
+            memory_allocation="1Gi",
+            cpu_allocation="250m",
+            replicas=1,
+            authentication_enabled=True,
+            encryption_enabled=False,
+            monitoring_enabled=False,
+            backup_enabled=False
+        ),
+        ClusterSize.SMALL: VectorStoreConfiguration(
+            provider="chroma",
+            namespace="vector-stores",
+            storage_size="25Gi",
+            memory_allocation="2Gi",
+            cpu_allocation="500m",
+            replicas=2,
+            authentication_enabled=True,
+            encryption_enabled=False,
+            monitoring_enabled=True,
+            backup_enabled=True
+        ),
+        ClusterSize.MEDIUM: VectorStoreConfiguration(
+            provider="chroma",
+            namespace="vector-stores",
+            storage_size="50Gi",
+            memory_allocation="4Gi",
+            cpu_allocation="1",
+            replicas=3,
+            authentication_enabled=True,
+            encryption_enabled=False,
+            monitoring_enabled=True,
+            backup_enabled=True
+        ),
+        ClusterSize.LARGE: VectorStoreConfiguration(
+            provider="chroma",
+            namespace="vector-stores",
+            storage_size="100Gi",
+            memory_allocation="8Gi",
+            cpu_allocation="2",
+            replicas=5,
+            authentication_enabled=True,
+            encryption_enabled=False,
+            monitoring_enabled=True,
+            backup_enabled=True
+        )
+    })
+
     def generate_helm_values(self, cluster_config: ClusterConfiguration) -> Dict[str, Any]:
         """Generate Chroma-specific Helm values"""
         base_config = self.get_default_configuration(cluster_config.size)
@@ -360,63 +430,26 @@ class ChromaProvider(VectorStoreProvider):
     
     def get_default_configuration(self, cluster_size: ClusterSize) -> VectorStoreConfiguration:
         """Get Chroma default configuration based on cluster size"""
-        size_configurations = {
-            ClusterSize.MINIMAL: VectorStoreConfiguration(
-                provider="chroma",
-                namespace="vector-stores",
-                storage_size="10Gi",
-                memory_allocation="1Gi",
-                cpu_allocation="250m",
-                replicas=1,
-                authentication_enabled=True,
-                encryption_enabled=False,
-                monitoring_enabled=False,
-                backup_enabled=False
-            ),
-            ClusterSize.SMALL: VectorStoreConfiguration(
-                provider="chroma",
-                namespace="vector-stores",
-                storage_size="25Gi",
-                memory_allocation="2Gi",
-                cpu_allocation="500m",
-                replicas=2,
-                authentication_enabled=True,
-                encryption_enabled=False,
-                monitoring_enabled=True,
-                backup_enabled=True
-            ),
-            ClusterSize.MEDIUM: VectorStoreConfiguration(
-                provider="chroma",
-                namespace="vector-stores",
-                storage_size="50Gi",
-                memory_allocation="4Gi",
-                cpu_allocation="1",
-                replicas=3,
-                authentication_enabled=True,
-                encryption_enabled=False,
-                monitoring_enabled=True,
-                backup_enabled=True
-            ),
-            ClusterSize.LARGE: VectorStoreConfiguration(
-                provider="chroma",
-                namespace="vector-stores",
-                storage_size="100Gi",
-                memory_allocation="8Gi",
-                cpu_allocation="2",
-                replicas=5,
-                authentication_enabled=True,
-                encryption_enabled=False,
-                monitoring_enabled=True,
-                backup_enabled=True
-            )
-        }
-        
-        return size_configurations.get(cluster_size, size_configurations[ClusterSize.SMALL])
+        return self._SIZE_CONFIGS.get(cluster_size, self._SIZE_CONFIGS[ClusterSize.SMALL])
 
 
 class ChromaInMemoryProvider(VectorStoreProvider):
     """In-memory Chroma provider for rapid prototyping"""
-    
+
+    # Size-independent, so a single shared instance suffices
+    _DEFAULT_CONFIG: ClassVar[VectorStoreConfiguration] = VectorStoreConfiguration(
+        provider="chroma-memory",
+        namespace="vector-stores",
+        storage_size="0Gi",
+        memory_allocation="1Gi",
+        cpu_allocation="250m",
+        replicas=1,
+        authentication_enabled=False,
+        encryption_enabled=False,
+        monitoring_enabled=False,
+        backup_enabled=False
+    )
+
     def generate_helm_values(self, cluster_config: ClusterConfiguration) -> Dict[str, Any]:
         """Generate in-memory Chroma configuration"""
         return {
@@ -458,18 +491,7 @@ class ChromaInMemoryProvider(VectorStoreProvider):
     
     def get_default_configuration(self, cluster_size: ClusterSize) -> VectorStoreConfiguration:
         """Get in-memory Chroma configuration"""
-        return VectorStoreConfiguration(
-            provider="chroma-memory",
-            namespace="vector-stores",
-            storage_size="0Gi",
-            memory_allocation="1Gi",
-            cpu_allocation="250m",
-            replicas=1,
-            authentication_enabled=False,
-            encryption_enabled=False,
-            monitoring_enabled=False,
-            backup_enabled=False
-        )
+        return self._DEFAULT_CONFIG
 
 
 class VectorStoreIntegrationManager:
@@ -482,6 +504,10 @@ class VectorStoreIntegrationManager:
             VectorStoreType.CHROMA: ChromaProvider(),
             VectorStoreType.CHROMA_MEMORY: ChromaInMemoryProvider()
         }
+        # Generated configurations are a pure function of the key fields;
+        # cache a pristine copy and hand out deep copies so caller
+        # mutations cannot leak back in
+        self._config_cache: Dict[tuple, Dict[str, Any]] = {}
     
     def get_provider(self, vector_store_type: VectorStoreType) -> VectorStoreProvider:
         """Get provider instance for vector store type"""
@@ -494,9 +520,15 @@ class VectorStoreIntegrationManager:
         """Generate complete vector store configuration"""
         if cluster_config.vector_store == VectorStoreType.DISABLED:
             return {}
-        
+
+        cache_key = _cluster_config_key(cluster_config)
+        cached = self._config_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Vector store configuration cache hit for {cluster_config.name}")
+            return copy.deepcopy(cached)
+
         provider = self.get_provider(cluster_config.vector_store)
-        
+
         configuration = {
             "enabled": True,
             "provider": cluster_config.vector_store.value,
@@ -512,7 +544,8 @@ class VectorStoreIntegrationManager:
         configuration["networking"] = self._generate_networking_configuration(cluster_config)
         
         logger.info(f"Generated {cluster_config.vector_store.value} configuration for {cluster_config.name}")
-        
+
+        self._config_cache[cache_key] = copy.deepcopy(configuration)
         return configuration
     
     def _generate_security_configuration(self, cluster_config: ClusterConfiguration) -> Dict[str, Any]:
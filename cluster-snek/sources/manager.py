@@ -22,6 +22,16 @@ from requests.auth import HTTPBasicAuth
 
 logger = logging.getLogger(__name__)
 
+# Compound tar suffixes: Path.suffix alone returns only ".gz" for
+# "charts.tar.gz", so detection must look at the last two suffixes
+_TAR_SUFFIXES = frozenset({'.tar', '.tgz', '.tar.gz', '.tar.bz2', '.tar.xz'})
+
+
+def _is_tar_archive(archive_path: Path) -> bool:
+    last = archive_path.suffix.lower()
+    joined = ''.join(archive_path.suffixes[-2:]).lower()
+    return last in _TAR_SUFFIXES or joined in _TAR_SUFFIXES
+
 
 @dataclass
 class SourceVerification:
@@ -172,10 +182,10 @@ class ArchiveSourceHandler:
         """Extract archive based on file extension"""
         destination.mkdir(parents=True, exist_ok=True)
         
-        if archive_path.suffix in ['.tar', '.tar.gz', '.tgz']:
+        if _is_tar_archive(archive_path):
             with tarfile.open(archive_path, 'r:*') as tar:
                 tar.extractall(destination)
-        elif archive_path.suffix == '.zip':
+        elif archive_path.suffix.lower() == '.zip':
             with zipfile.ZipFile(archive_path, 'r') as zip_file:
                 zip_file.extractall(destination)
         else: